@@ -1,4 +1,6 @@
+import copy
 import datetime
+import json
 import numpy as np
 import pandas as pd
 import pandera as pa
@@ -7,13 +9,14 @@ import warnings
 import zipfile
 import os
 
+from functools import lru_cache
 from io import BytesIO
 from os import listdir
 from requests.sessions import Session
 from requests import RequestException
 from typing import List, Optional, Union
 
-from asf_levies_model import config, PROJECT_DIR
+from asf_levies_model import config, logger, PROJECT_DIR
 
 # Create Ofgem annex data route variable from config
 if config.get("data_downloads").get("annex"):
@@ -49,6 +52,101 @@ else:
     # If no data_output root has been given, just use the base PROJECT_DIR
     ARCHETYPE_DATA_ROOT = str(PROJECT_DIR) + "/"
 
+# Maximum number of failing values reported per pandera check
+N_FAILURE_CASES = 10
+
+
+def _annex_filepath(date: str, annex: int) -> str:
+    """Gets filepath of a locally stored annex downloaded on a given date (YYYYMMDD)."""
+    return f"{DATA_ROOT}{date}_ofgem_annex_{annex}.xlsx"
+
+
+def _annex_headers_filepath(annex: int) -> str:
+    """Gets filepath of the sidecar storing HTTP validators for local annex copies."""
+    return f"{DATA_ROOT}ofgem_annex_{annex}_headers.json"
+
+
+def _download_annex(
+    url: str, annex: int, as_fileobject: bool = False
+) -> Optional[BytesIO]:
+    """Retrieves annex xlsx file and either saves to a file or returns a fileobject.
+
+    When saving, the ETag and Last-Modified headers of the response are stored alongside
+    the file and sent with the next request. If Ofgem reports the file as unchanged, the
+    existing local copy is re-dated rather than downloaded again. New downloads are only
+    moved into place once complete, so a failed transfer leaves the previous copy intact.
+
+    Args:
+        url: str, url of relevant Ofgem annex xlsx file.
+        annex: int, annex number.
+        as_fileobject: bool (default: False), whether to save to disk or return BytesIO fileobject.
+
+    Returns:
+        Optionally, None or BytesIO fileobject.
+    """
+    with Session() as session:
+        try:
+            if as_fileobject:
+                response = session.get(url)
+                response.raise_for_status()
+                return BytesIO(response.content)
+
+            headers_filepath = _annex_headers_filepath(annex)
+            try:
+                with open(headers_filepath) as file:
+                    cached = json.load(file)
+            except (FileNotFoundError, json.JSONDecodeError):
+                cached = {}
+            request_headers = {}
+            if cached.get("url") == url and os.path.exists(
+                _annex_filepath(cached.get("date"), annex)
+            ):
+                if cached.get("etag"):
+                    request_headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    request_headers["If-Modified-Since"] = cached["last_modified"]
+
+            date = datetime.datetime.now().strftime("%Y%m%d")
+            filepath = _annex_filepath(date, annex)
+            with session.get(url, headers=request_headers, stream=True) as response:
+                response.raise_for_status()
+                if response.status_code == 304:
+                    os.replace(_annex_filepath(cached["date"], annex), filepath)
+                    logger.info("Local copy of annex %d is up to date.", annex)
+                    # A 304 need not repeat validators, so keep any it omits
+                    etag = response.headers.get("ETag", cached.get("etag"))
+                    last_modified = response.headers.get(
+                        "Last-Modified", cached.get("last_modified")
+                    )
+                else:
+                    # Only replace the dated file once the full body has arrived
+                    partial_filepath = f"{filepath}.part"
+                    try:
+                        with open(partial_filepath, mode="wb") as file:
+                            for chunk in response.iter_content(chunk_size=1 << 20):
+                                file.write(chunk)
+                        os.replace(partial_filepath, filepath)
+                    except BaseException:
+                        if os.path.exists(partial_filepath):
+                            os.remove(partial_filepath)
+                        raise
+                    logger.info("File retrieved successfully.")
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
+                with open(headers_filepath, mode="w") as file:
+                    json.dump(
+                        {
+                            "url": url,
+                            "date": date,
+                            "etag": etag,
+                            "last_modified": last_modified,
+                        },
+                        file,
+                    )
+            clear_data_cache()
+        except RequestException as rex:
+            logger.error("Failed to download annex %d: %s", annex, rex)
+
 
 # Functions for getting and processing Annex 4 data
 
@@ -66,18 +164,7 @@ def download_annex_4(
     Returns:
         Optionally, None or BytesIO fileobject.
     """
-    with Session() as session:
-        try:
-            response = session.get(url)
-            if not as_fileobject:
-                date = datetime.datetime.now().strftime("%Y%m%d")
-                with open(f"{DATA_ROOT}{date}_ofgem_annex_4.xlsx", mode="wb") as file:
-                    file.write(response.content)
-            else:
-                return BytesIO(response.content)
-            print("File retrieved successfully.")
-        except RequestException as rex:
-            print("Failed to download annex 4", rex)
+    return _download_annex(url, 4, as_fileobject)
 
 
 def _find_latest_annex(data_root: str, annex_to_find: int) -> str:
@@ -85,7 +172,7 @@ def _find_latest_annex(data_root: str, annex_to_find: int) -> str:
     available_dates = [
         f.split("_")[0]
         for f in listdir(data_root)
-        if f"ofgem_annex_{annex_to_find}" in f
+        if f.endswith(f"ofgem_annex_{annex_to_find}.xlsx")
     ]
     if len(available_dates) > 0:
         return sorted(available_dates, reverse=True)[0]
@@ -93,6 +180,18 @@ def _find_latest_annex(data_root: str, annex_to_find: int) -> str:
         raise FileNotFoundError(f"No local copies of Annex {annex_to_find} available.")
 
 
+def _latest_annex_filepath(annex: int) -> str:
+    """Gets filepath of most recent stored annex, warning if it is over a week old."""
+    latest_annex = _find_latest_annex(DATA_ROOT, annex)
+    if (
+        day_diff := (
+            datetime.datetime.now() - datetime.datetime.strptime(latest_annex, "%Y%m%d")
+        ).days
+    ) > 7:
+        warnings.warn(f"Using copy of Annex {annex} downloaded {day_diff} days ago.")
+    return _annex_filepath(latest_annex, annex)
+
+
 def _get_excel_sheet_names(file_path: Union[str, BytesIO]) -> list:
     """Gets xlsx sheet names quickly for file or fileobject.
 
@@ -110,6 +209,73 @@ def _get_excel_sheet_names(file_path: Union[str, BytesIO]) -> list:
     return sheets
 
 
+@lru_cache(maxsize=None)
+def _read_local_annex_sheet(
+    filepath: str, sheet_name: str, modified: float, skiprows: Optional[int] = None
+) -> pd.DataFrame:
+    """Reads a sheet from a locally stored annex xlsx file.
+
+    Local copies are named by download date, so reads are memoised on filepath, sheet
+    and modification time. Callers should copy the returned dataframe before modifying it.
+
+    Args:
+        filepath: str, path to date-stamped annex xlsx file.
+        sheet_name: str, name of sheet to read.
+        modified: float, modification time of filepath, used to invalidate the cache.
+        skiprows: None or int, number of rows to skip at the start of the sheet.
+
+    Returns:
+        pandas DataFrame of the raw sheet.
+    """
+    return pd.read_excel(
+        filepath,
+        sheet_name=sheet_name,
+        skiprows=skiprows,
+        header=1,
+        index_col=0,
+        engine="calamine",
+    ).reset_index(drop=True)
+
+
+@lru_cache(maxsize=8)
+def _read_annex_fileobject_sheet(
+    content: bytes, sheet_name: str, skiprows: Optional[int] = None
+) -> pd.DataFrame:
+    """Reads a sheet from an in-memory annex xlsx file.
+
+    Reads are memoised on the file content, so the same downloaded fileobject can be
+    passed to several process functions without re-parsing. Callers should copy the
+    returned dataframe before modifying it.
+
+    Args:
+        content: bytes, contents of annex xlsx fileobject.
+        sheet_name: str, name of sheet to read.
+        skiprows: None or int, number of rows to skip at the start of the sheet.
+
+    Returns:
+        pandas DataFrame of the raw sheet.
+    """
+    return pd.read_excel(
+        BytesIO(content),
+        sheet_name=sheet_name,
+        skiprows=skiprows,
+        header=1,
+        index_col=0,
+        engine="calamine",
+    ).reset_index(drop=True)
+
+
+def clear_data_cache():
+    """Clears memoised annex sheets and archetype datasets.
+
+    Cached reads are keyed on file modification time or content, so this is only needed
+    to free memory held by superseded copies. It is called after each annex download.
+    """
+    _read_local_annex_sheet.cache_clear()
+    _read_annex_fileobject_sheet.cache_clear()
+    _read_archetypes_pickle.cache_clear()
+
+
 def _get_raw_dataframe_annex4(
     policy_name: str, fileobject: Optional[BytesIO] = None
 ) -> pd.DataFrame:
@@ -124,15 +290,7 @@ def _get_raw_dataframe_annex4(
         pandas DataFrame of Annex 4 data for specified policy_name.
     """
     if not fileobject:
-        date = datetime.datetime.now()
-        latest_annex_4 = _find_latest_annex(DATA_ROOT, 4)
-        if (
-            day_diff := (
-                date - datetime.datetime.strptime(latest_annex_4, "%Y%m%d")
-            ).days
-        ) > 7:
-            warnings.warn(f"Using copy of Annex 4 downloaded {day_diff} days ago.")
-        filepath = f"{DATA_ROOT}{latest_annex_4}_ofgem_annex_4.xlsx"
+        filepath = _latest_annex_filepath(4)
         try:
             sheet = [
                 sheet_name
@@ -142,14 +300,9 @@ def _get_raw_dataframe_annex4(
         except:
             raise ValueError("Acronym given does not correspond to a valid policy.")
 
-        return pd.read_excel(
-            filepath,
-            sheet_name=sheet,
-            skiprows=4,
-            header=1,
-            index_col=0,
-            engine="calamine",
-        ).reset_index(drop=True)
+        return _read_local_annex_sheet(
+            filepath, sheet, os.path.getmtime(filepath), skiprows=4
+        ).copy()
     else:
         try:
             sheet = [
@@ -159,14 +312,9 @@ def _get_raw_dataframe_annex4(
             ][0]
         except:
             raise ValueError("Acronym given does not correspond to a valid policy.")
-        return pd.read_excel(
-            fileobject,
-            sheet_name=sheet,
-            skiprows=4,
-            header=1,
-            index_col=0,
-            engine="calamine",
-        ).reset_index(drop=True)
+        return _read_annex_fileobject_sheet(
+            fileobject.getvalue(), sheet, skiprows=4
+        ).copy()
 
 
 def _get_update_dates(policy_df: pd.DataFrame) -> list:
@@ -201,7 +349,7 @@ def _get_charging_years(policy_df: pd.DataFrame, policy_acronym: str) -> list:
 def _check_updates_years(update_dates: list, charging_years: list):
     """Checks if number of dates of update and number of charging years are equal."""
     if len(update_dates) == len(charging_years):
-        print(f"Number of entries: {len(update_dates)}")
+        logger.debug("Number of entries: %d", len(update_dates))
     else:
         raise ValueError("Number of time periods do not match!")
 
@@ -245,16 +393,18 @@ def _process_data(
     # Check update dates and charging years match
     _check_updates_years(update_dates, charging_years)
     policy_data = _extract_policy_data(policy_parameters, df, update_dates)
-    data_tidy_df = pd.concat(
-        [
-            pd.Series(update_dates, name="UpdateDate"),
-            pd.Series(charging_years, name="SchemeYear"),
-        ]
-        + [
-            pd.Series(policy_data[i], name=parameter)
-            for i, parameter in enumerate(column_names)
-        ],
-        axis=1,
+    # Check a value was found for every update date
+    if policy_data.shape[1] != len(update_dates):
+        raise ValueError("Number of time periods do not match!")
+    # Check a row was found for every parameter
+    if policy_data.shape[0] != len(column_names):
+        raise ValueError("Number of parameters do not match!")
+    data_tidy_df = pd.DataFrame(
+        {
+            "UpdateDate": update_dates,
+            "SchemeYear": charging_years,
+            **dict(zip(column_names, policy_data)),
+        }
     )
     # Make UpdateDate a datetime
     data_tidy_df["UpdateDate"] = pd.to_datetime(
@@ -354,16 +504,39 @@ def process_data_ECO(fileobject: Optional[BytesIO] = None) -> pd.DataFrame:
     return eco_df
 
 
-def validate_input_data(policy_data_tidy_df: pd.DataFrame, policy_data_schema: dict):
-    """Perform validation checks on each column of a dataframe with policy-specific data schema."""
+def validate_input_data(
+    policy_data_tidy_df: pd.DataFrame, policy_data_schema: dict
+) -> pd.DataFrame:
+    """Perform validation checks on each column of a dataframe with policy-specific data schema.
+
+    Returns the validated (coerced) dataframe, which carries its schema. Dataframes already
+    validated against an equal schema are returned without being checked again.
+
+    Checks without an explicit n_failure_cases report at most N_FAILURE_CASES failing
+    values each, so a badly parsed sheet cannot produce an unbounded error report. Pass
+    n_failure_cases to a check explicitly to override this.
+    """
+
+    schema = pa.DataFrameSchema(copy.deepcopy(policy_data_schema), coerce=True)
+    for check in schema.checks + [
+        check for column in schema.columns.values() for check in column.checks
+    ]:
+        if check.n_failure_cases is None:
+            check.n_failure_cases = N_FAILURE_CASES
 
-    schema = pa.DataFrameSchema(policy_data_schema, coerce=True)
+    if (
+        getattr(policy_data_tidy_df, "pandera", None) is not None
+        and policy_data_tidy_df.pandera.schema == schema
+    ):
+        return policy_data_tidy_df
 
     try:
-        schema.validate(policy_data_tidy_df, lazy=True)
-        print("All column types are validated.")
+        policy_data_tidy_df = schema.validate(policy_data_tidy_df, lazy=True)
+        logger.info("All column types are validated.")
     except pa.errors.SchemaErrors as exc:
-        print(exc)
+        logger.error("%s", exc)
+
+    return policy_data_tidy_df
 
 
 def _get_charging_periods(policy_df: pd.DataFrame) -> List[np.array]:
@@ -394,7 +567,7 @@ def _get_lookup_periods(policy_df: pd.DataFrame) -> np.array:
 def _check_periods(charge_period_1: list, charge_period_2: list, lookup_period: list):
     """Checks if number of charge periods and lookup periods are equal."""
     if len(charge_period_1) == len(charge_period_2) == len(lookup_period):
-        print(f"Number of entries: {len(charge_period_1)}")
+        logger.debug("Number of entries: %d", len(charge_period_1))
         return True
     else:
         return False
@@ -449,18 +622,19 @@ def process_data_FIT(fileobject: Optional[BytesIO] = None) -> pd.DataFrame:
         "ExemptSupplyOutsideUK",
         "ExemptSupplyEII",
     ]
+    # Check a value was found for every lookup period and parameter
+    if FIT_parameters.shape[1] != len(lookup_periods):
+        raise ValueError("Number of time periods do not match!")
+    if FIT_parameters.shape[0] != len(column_names):
+        raise ValueError("Number of parameters do not match!")
     # Create dataframe containing FIT data in tidy format
-    data_tidy_df = pd.concat(
-        [
-            pd.Series(charge_periods_1, name="ChargeRestrictionPeriod1"),
-            pd.Series(charge_periods_2, name="ChargeRestrictionPeriod2"),
-            pd.Series(lookup_periods, name="LookupPeriod"),
-        ]
-        + [
-            pd.Series(FIT_parameters[i], name=parameter)
-            for i, parameter in enumerate(column_names)
-        ],
-        axis=1,
+    data_tidy_df = pd.DataFrame(
+        {
+            "ChargeRestrictionPeriod1": charge_periods_1,
+            "ChargeRestrictionPeriod2": charge_periods_2,
+            "LookupPeriod": lookup_periods,
+            **dict(zip(column_names, FIT_parameters)),
+        }
     )
     data_tidy_df["ChargeRestrictionPeriod2_start"] = pd.to_datetime(
         data_tidy_df["ChargeRestrictionPeriod2"].str.split("\s?-\s?", expand=True)[0],
@@ -489,18 +663,7 @@ def download_annex_9(
     Returns:
         Optionally, None or BytesIO fileobject.
     """
-    with Session() as session:
-        try:
-            response = session.get(url)
-            if not as_fileobject:
-                date = datetime.datetime.now().strftime("%Y%m%d")
-                with open(f"{DATA_ROOT}{date}_ofgem_annex_9.xlsx", mode="wb") as file:
-                    file.write(response.content)
-            else:
-                return BytesIO(response.content)
-            print("File retrieved successfully.")
-        except RequestException as rex:
-            print("Failed to download annex 9", rex)
+    return _download_annex(url, 9, as_fileobject)
 
 
 def _get_raw_dataframe_annex9(
@@ -509,15 +672,7 @@ def _get_raw_dataframe_annex9(
     """Creates a pandas dataframe of raw data from Ofgem Annex 9
     spreadsheet tab corresponding to policy of interest."""
     if not fileobject:
-        date = datetime.datetime.now()
-        latest_annex_9 = _find_latest_annex(DATA_ROOT, 9)
-        if (
-            day_diff := (
-                date - datetime.datetime.strptime(latest_annex_9, "%Y%m%d")
-            ).days
-        ) > 7:
-            warnings.warn(f"Using copy of Annex 9 downloaded {day_diff} days ago.")
-        filepath = f"{DATA_ROOT}{latest_annex_9}_ofgem_annex_9.xlsx"
+        filepath = _latest_annex_filepath(9)
         try:
             sheet = [
                 sheet_name
@@ -529,9 +684,9 @@ def _get_raw_dataframe_annex9(
                 "Input does not correspond to a valid tab in the spreadsheet."
             )
 
-        return pd.read_excel(
-            filepath, sheet_name=sheet, header=1, index_col=0, engine="calamine"
-        ).reset_index(drop=True)
+        return _read_local_annex_sheet(
+            filepath, sheet, os.path.getmtime(filepath)
+        ).copy()
     else:
         try:
             sheet = [
@@ -544,9 +699,7 @@ def _get_raw_dataframe_annex9(
                 "Input does not correspond to a valid tab in the spreadsheet."
             )
 
-        return pd.read_excel(
-            fileobject, sheet_name=sheet, header=1, index_col=0, engine="calamine"
-        ).reset_index(drop=True)
+        return _read_annex_fileobject_sheet(fileobject.getvalue(), sheet).copy()
 
 
 def _slice_tariff_components_tables(
@@ -711,172 +864,106 @@ def _process_tariff(
     )
 
 
+# Location of each tariff components table in sheet "1c Consumption adjusted levels":
+# (sheet_start_row, levelisation, type_of_consumption, table_number)
+_TARIFF_TABLES = {
+    "elec_standard_credit_nil": (55, False, "Nil consumption", 1),
+    "elec_standard_credit_typical": (70, False, "Typical consumption", 1),
+    "gas_standard_credit_nil": (55, False, "Nil consumption", 3),
+    "gas_standard_credit_typical": (70, False, "Typical consumption", 3),
+    "elec_other_payment_nil": (19, True, "Nil consumption", 1),
+    "elec_other_payment_typical": (35, True, "Typical consumption", 1),
+    "gas_other_payment_nil": (19, True, "Nil consumption", 3),
+    "gas_other_payment_typical": (35, True, "Typical consumption", 3),
+    "elec_ppm_nil": (88, True, "Nil consumption", 1),
+    "elec_ppm_typical": (104, True, "Typical consumption", 1),
+    "gas_ppm_nil": (88, True, "Nil consumption", 3),
+    "gas_ppm_typical": (104, True, "Typical consumption", 3),
+}
+
+
 ## Standard Credit
 # Electricity
 def process_tariff_elec_standard_credit_nil(fileobject: Optional[BytesIO] = None):
     """Extracts and transforms Standard Credit tariff component data from annex 9 for Electricity: Single-Rate Metering Arrangement, Nil consumption."""
-    sheet_start_row = 55
-    levelisation = False
-    type_of_consumption = "Nil consumption"
-    table_number = 1
-    return _process_tariff(
-        sheet_start_row, levelisation, type_of_consumption, table_number, fileobject
-    )
+    return _process_tariff(*_TARIFF_TABLES["elec_standard_credit_nil"], fileobject)
 
 
-def process_tariff_elec_standard_credit_typical(
-    fileobject: Optional[BytesIO] = None,
-):
+def process_tariff_elec_standard_credit_typical(fileobject: Optional[BytesIO] = None):
     """Extracts and transforms Standard Credit tariff component data from annex 9 for Electricity: Single-Rate Metering Arrangement, Typical consumption."""
-    sheet_start_row = 70
-    levelisation = False
-    type_of_consumption = "Typical consumption"
-    table_number = 1
-    return _process_tariff(
-        sheet_start_row, levelisation, type_of_consumption, table_number, fileobject
-    )
+    return _process_tariff(*_TARIFF_TABLES["elec_standard_credit_typical"], fileobject)
 
 
 # Gas
-def process_tariff_gas_standard_credit_nil(
-    fileobject: Optional[BytesIO] = None,
-):
+def process_tariff_gas_standard_credit_nil(fileobject: Optional[BytesIO] = None):
     """Extracts and transforms Standard Credit tariff component data from annex 9 for Gas, Nil consumption."""
-    sheet_start_row = 55
-    levelisation = False
-    type_of_consumption = "Nil consumption"
-    table_number = 3
-    return _process_tariff(
-        sheet_start_row, levelisation, type_of_consumption, table_number, fileobject
-    )
+    return _process_tariff(*_TARIFF_TABLES["gas_standard_credit_nil"], fileobject)
 
 
-def process_tariff_gas_standard_credit_typical(
-    fileobject: Optional[BytesIO] = None,
-):
+def process_tariff_gas_standard_credit_typical(fileobject: Optional[BytesIO] = None):
     """Extracts and transforms Standard Credit tariff component data from annex 9 for Gas, Typical consumption."""
-    sheet_start_row = 70
-    levelisation = False
-    type_of_consumption = "Typical consumption"
-    table_number = 3
-    return _process_tariff(
-        sheet_start_row, levelisation, type_of_consumption, table_number, fileobject
-    )
+    return _process_tariff(*_TARIFF_TABLES["gas_standard_credit_typical"], fileobject)
 
 
 ## Other payment method
 # Electricity
-def process_tariff_elec_other_payment_nil(
-    fileobject: Optional[BytesIO] = None,
-):
+def process_tariff_elec_other_payment_nil(fileobject: Optional[BytesIO] = None):
     """Extracts and transforms Other Payment Method tariff component data from annex 9 for Electricity: Single-Rate Metering Arrangement, Nil consumption."""
-    sheet_start_row = 19
-    levelisation = True
-    type_of_consumption = "Nil consumption"
-    table_number = 1
-    return _process_tariff(
-        sheet_start_row, levelisation, type_of_consumption, table_number, fileobject
-    )
+    return _process_tariff(*_TARIFF_TABLES["elec_other_payment_nil"], fileobject)
 
 
-def process_tariff_elec_other_payment_typical(
-    fileobject: Optional[BytesIO] = None,
-):
+def process_tariff_elec_other_payment_typical(fileobject: Optional[BytesIO] = None):
     """Extracts and transforms Other Payment Method tariff component data from annex 9 for Electricity: Single-Rate Metering Arrangement, Typical consumption."""
-    sheet_start_row = 35
-    levelisation = True
-    type_of_consumption = "Typical consumption"
-    table_number = 1
-    return _process_tariff(
-        sheet_start_row, levelisation, type_of_consumption, table_number, fileobject
-    )
+    return _process_tariff(*_TARIFF_TABLES["elec_other_payment_typical"], fileobject)
 
 
 # Gas
-def process_tariff_gas_other_payment_nil(
-    fileobject: Optional[BytesIO] = None,
-):
+def process_tariff_gas_other_payment_nil(fileobject: Optional[BytesIO] = None):
     """Extracts and transforms Other Payment Method tariff component data from annex 9 for Gas, Nil consumption."""
-    sheet_start_row = 19
-    levelisation = True
-    type_of_consumption = "Nil consumption"
-    table_number = 3
-    return _process_tariff(
-        sheet_start_row, levelisation, type_of_consumption, table_number, fileobject
-    )
+    return _process_tariff(*_TARIFF_TABLES["gas_other_payment_nil"], fileobject)
 
 
-def process_tariff_gas_other_payment_typical(
-    fileobject: Optional[BytesIO] = None,
-):
+def process_tariff_gas_other_payment_typical(fileobject: Optional[BytesIO] = None):
     """Extracts and transforms Other Payment Method tariff component data from annex 9 for Gas, Typical consumption."""
-    sheet_start_row = 35
-    levelisation = True
-    type_of_consumption = "Typical consumption"
-    table_number = 3
-    return _process_tariff(
-        sheet_start_row, levelisation, type_of_consumption, table_number, fileobject
-    )
+    return _process_tariff(*_TARIFF_TABLES["gas_other_payment_typical"], fileobject)
 
 
 ## PPM
 # Electricity
-def process_tariff_elec_ppm_nil(
-    fileobject: Optional[BytesIO] = None,
-):
+def process_tariff_elec_ppm_nil(fileobject: Optional[BytesIO] = None):
     """Extracts and transforms PPM tariff component data from annex 9 for Electricity: Single-Rate Metering Arrangement, Nil consumption."""
-    sheet_start_row = 88
-    levelisation = True
-    type_of_consumption = "Nil consumption"
-    table_number = 1
-    return _process_tariff(
-        sheet_start_row, levelisation, type_of_consumption, table_number, fileobject
-    )
+    return _process_tariff(*_TARIFF_TABLES["elec_ppm_nil"], fileobject)
 
 
-def process_tariff_elec_ppm_typical(
-    fileobject: Optional[BytesIO] = None,
-):
+def process_tariff_elec_ppm_typical(fileobject: Optional[BytesIO] = None):
     """Extracts and transforms PPM tariff component data from annex 9 for Electricity: Single-Rate Metering Arrangement, Typical consumption."""
-    sheet_start_row = 104
-    levelisation = True
-    type_of_consumption = "Typical consumption"
-    table_number = 1
-    return _process_tariff(
-        sheet_start_row, levelisation, type_of_consumption, table_number, fileobject
-    )
+    return _process_tariff(*_TARIFF_TABLES["elec_ppm_typical"], fileobject)
 
 
 # Gas
-def process_tariff_gas_ppm_nil(
-    fileobject: Optional[BytesIO] = None,
-):
+def process_tariff_gas_ppm_nil(fileobject: Optional[BytesIO] = None):
     """Extracts and transforms PPM tariff component data from annex 9 for Gas, Nil consumption."""
-    sheet_start_row = 88
-    levelisation = True
-    type_of_consumption = "Nil consumption"
-    table_number = 3
-    return _process_tariff(
-        sheet_start_row, levelisation, type_of_consumption, table_number, fileobject
-    )
+    return _process_tariff(*_TARIFF_TABLES["gas_ppm_nil"], fileobject)
 
 
-def process_tariff_gas_ppm_typical(
-    fileobject: Optional[BytesIO] = None,
-):
+def process_tariff_gas_ppm_typical(fileobject: Optional[BytesIO] = None):
     """Extracts and transforms PPM tariff component data from annex 9 for Gas, Typical consumption."""
-    sheet_start_row = 104
-    levelisation = True
-    type_of_consumption = "Typical consumption"
-    table_number = 3
-    return _process_tariff(
-        sheet_start_row, levelisation, type_of_consumption, table_number, fileobject
-    )
+    return _process_tariff(*_TARIFF_TABLES["gas_ppm_typical"], fileobject)
+
+
+@lru_cache(maxsize=None)
+def _read_archetypes_pickle(filepath: str, modified: float) -> pd.DataFrame:
+    """Reads a pickled archetype dataset, memoised on filepath and modification time.
+
+    Callers should copy the returned dataframe before modifying it.
+    """
+    return pd.read_pickle(filepath)
 
 
 def _ofgem_archetypes_dataset(descriptor: str) -> pd.DataFrame:
     """General function to generate a dataframe with Ofgem archetype data from a pickle file."""
-    return pd.read_pickle(f"{ARCHETYPE_DATA_ROOT}archetypes_{descriptor}.pkl")
+    filepath = f"{ARCHETYPE_DATA_ROOT}archetypes_{descriptor}.pkl"
+    return _read_archetypes_pickle(filepath, os.path.getmtime(filepath)).copy()
 
 
 def ofgem_archetypes_data() -> pd.DataFrame:
@@ -7,6 +7,16 @@ from typing import Optional
 from asf_levies_model.utils.utils import _generate_docstring
 
 
+def _latest_record(df: pd.DataFrame, mask: pd.Series, date_column: str) -> dict:
+    """Return the row of df with the latest date_column value among rows where mask holds.
+
+    Rows are selected by position, so duplicate index labels (e.g. from concatenated
+    dataframes) are handled.
+    """
+    candidates = df[mask & df[date_column].notna()]
+    return candidates.iloc[candidates[date_column].to_numpy().argmax()].to_dict()
+
+
 class Levy:
     """A generic levy object for gas and electricity policy costs and rebalancing.
 
@@ -143,6 +153,21 @@ class Levy:
             self.gas_fixed_rate * gas_customer
         )
 
+    def get_weights(self) -> dict:
+        """Return current levy weights, keyed by rebalance_levy argument names.
+
+        Useful for describing the status quo as a rebalancing scenario.
+        """
+        return {
+            "new_electricity_weight": self.electricity_weight,
+            "new_gas_weight": self.gas_weight,
+            "new_tax_weight": self.tax_weight,
+            "new_variable_weight_elec": self.electricity_variable_weight,
+            "new_fixed_weight_elec": self.electricity_fixed_weight,
+            "new_variable_weight_gas": self.gas_variable_weight,
+            "new_fixed_weight_gas": self.gas_fixed_weight,
+        }
+
     def update_revenue(
         self,
         new_revenue: float,
@@ -188,38 +213,37 @@ class Levy:
             raise AttributeError("Error in assigning new revenue to Levy.")
 
         # 2. Update levy rate
-        # Revenue contributions
-        revenue_gas = revenue * self.gas_weight
-        revenue_elec = revenue * self.electricity_weight
-        revenue_tax = revenue * self.tax_weight
-        # New variable levy rate
-        new_levy_var_gas = (revenue_gas / supply_gas) * self.gas_variable_weight
-        new_levy_var_elec = (
-            revenue_elec / supply_elec
-        ) * self.electricity_variable_weight
-        # New fixed levy rate
-        new_levy_fixed_gas = (revenue_gas / customers_gas) * self.gas_fixed_weight
-        new_levy_fixed_elec = (
-            revenue_elec / customers_elec
-        ) * self.electricity_fixed_weight
-
-        if inplace:
-            # Update revenue
-            self.revenue = revenue
-            self.electricity_variable_rate = new_levy_var_elec
-            self.electricity_fixed_rate = new_levy_fixed_elec
-            self.gas_variable_rate = new_levy_var_gas
-            self.gas_fixed_rate = new_levy_fixed_gas
-            self.general_taxation = revenue_tax
-        else:
-            # Return copy
-            new_levy = copy.deepcopy(self)
-            new_levy.revenue = revenue
-            new_levy.electricity_variable_rate = new_levy_var_elec
-            new_levy.electricity_fixed_rate = new_levy_fixed_elec
-            new_levy.gas_variable_rate = new_levy_var_gas
-            new_levy.gas_fixed_rate = new_levy_fixed_gas
-            new_levy.general_taxation = revenue_tax
+        (
+            new_levy_var_gas,
+            new_levy_var_elec,
+            new_levy_fixed_gas,
+            new_levy_fixed_elec,
+            revenue_tax,
+        ) = self._calculate_rates(
+            revenue,
+            self.electricity_weight,
+            self.gas_weight,
+            self.tax_weight,
+            self.electricity_variable_weight,
+            self.electricity_fixed_weight,
+            self.gas_variable_weight,
+            self.gas_fixed_weight,
+            supply_gas,
+            supply_elec,
+            customers_gas,
+            customers_elec,
+        )
+
+        # Update instance inplace or return copy
+        new_levy = self if inplace else copy.deepcopy(self)
+        new_levy.revenue = revenue
+        new_levy.electricity_variable_rate = new_levy_var_elec
+        new_levy.electricity_fixed_rate = new_levy_fixed_elec
+        new_levy.gas_variable_rate = new_levy_var_gas
+        new_levy.gas_fixed_rate = new_levy_fixed_gas
+        new_levy.general_taxation = revenue_tax
+
+        if not inplace:
             return new_levy
 
     def rebalance_levy(
@@ -264,19 +288,26 @@ class Levy:
                 Raises:
                     ValueError: if rebalancing fails to maintain total revenue.
         """
-
-        # Revenue contributions
-        revenue_gas = self.revenue * new_gas_weight
-        revenue_elec = self.revenue * new_electricity_weight
-        revenue_tax = self.revenue * new_tax_weight
-
-        # New variable levy rate
-        new_levy_var_gas = (revenue_gas / supply_gas) * new_variable_weight_gas
-        new_levy_var_elec = (revenue_elec / supply_elec) * new_variable_weight_elec
-
-        # New fixed levy rate
-        new_levy_fixed_gas = (revenue_gas / customers_gas) * new_fixed_weight_gas
-        new_levy_fixed_elec = (revenue_elec / customers_elec) * new_fixed_weight_elec
+        (
+            new_levy_var_gas,
+            new_levy_var_elec,
+            new_levy_fixed_gas,
+            new_levy_fixed_elec,
+            revenue_tax,
+        ) = self._calculate_rates(
+            self.revenue,
+            new_electricity_weight,
+            new_gas_weight,
+            new_tax_weight,
+            new_variable_weight_elec,
+            new_fixed_weight_elec,
+            new_variable_weight_gas,
+            new_fixed_weight_gas,
+            supply_gas,
+            supply_elec,
+            customers_gas,
+            customers_elec,
+        )
 
         if not self._is_revenue_maintained(
             new_levy_var_gas,
@@ -294,42 +325,60 @@ class Levy:
                 "Rebalancing failed to maintain revenue. (Try: Check that new electricity-gas-tax and fixed-variable weights provided add up to 1, respectively.)"
             )
 
-        if inplace:
-            # Update attributes
-            self.electricity_weight = new_electricity_weight
-            self.gas_weight = new_gas_weight
-            self.tax_weight = new_tax_weight
-
-            self.electricity_variable_weight = new_variable_weight_elec
-            self.electricity_fixed_weight = new_fixed_weight_elec
-            self.gas_variable_weight = new_variable_weight_gas
-            self.gas_fixed_weight = new_fixed_weight_gas
-
-            self.electricity_variable_rate = new_levy_var_elec
-            self.electricity_fixed_rate = new_levy_fixed_elec
-            self.gas_variable_rate = new_levy_var_gas
-            self.gas_fixed_rate = new_levy_fixed_gas
-            self.general_taxation = revenue_tax
-        else:
-            # Return copy
-            new_levy = copy.deepcopy(self)
-            # Update attributes
-            new_levy.electricity_weight = new_electricity_weight
-            new_levy.gas_weight = new_gas_weight
-            new_levy.tax_weight = new_tax_weight
-
-            new_levy.electricity_variable_weight = new_variable_weight_elec
-            new_levy.electricity_fixed_weight = new_fixed_weight_elec
-            new_levy.gas_variable_weight = new_variable_weight_gas
-            new_levy.gas_fixed_weight = new_fixed_weight_gas
-
-            new_levy.electricity_variable_rate = new_levy_var_elec
-            new_levy.electricity_fixed_rate = new_levy_fixed_elec
-            new_levy.gas_variable_rate = new_levy_var_gas
-            new_levy.gas_fixed_rate = new_levy_fixed_gas
-            new_levy.general_taxation = revenue_tax
+        # Update instance inplace or return copy
+        new_levy = self if inplace else copy.deepcopy(self)
+        new_levy.electricity_weight = new_electricity_weight
+        new_levy.gas_weight = new_gas_weight
+        new_levy.tax_weight = new_tax_weight
+
+        new_levy.electricity_variable_weight = new_variable_weight_elec
+        new_levy.electricity_fixed_weight = new_fixed_weight_elec
+        new_levy.gas_variable_weight = new_variable_weight_gas
+        new_levy.gas_fixed_weight = new_fixed_weight_gas
+
+        new_levy.electricity_variable_rate = new_levy_var_elec
+        new_levy.electricity_fixed_rate = new_levy_fixed_elec
+        new_levy.gas_variable_rate = new_levy_var_gas
+        new_levy.gas_fixed_rate = new_levy_fixed_gas
+        new_levy.general_taxation = revenue_tax
+
+        if not inplace:
             return new_levy
 
+    @staticmethod
+    def _calculate_rates(
+        revenue: float,
+        electricity_weight: float,
+        gas_weight: float,
+        tax_weight: float,
+        variable_weight_elec: float,
+        fixed_weight_elec: float,
+        variable_weight_gas: float,
+        fixed_weight_gas: float,
+        supply_gas: float,
+        supply_elec: float,
+        customers_gas: int,
+        customers_elec: int,
+    ) -> tuple:
+        """Apportions revenue and derives new levy rates from the provided denominators.
+
+        Returns:
+            Tuple of gas variable rate, electricity variable rate, gas fixed rate,
+        electricity fixed rate and general taxation revenue.
+        """
+        # Revenue contributions
+        revenue_gas = revenue * gas_weight
+        revenue_elec = revenue * electricity_weight
+        revenue_tax = revenue * tax_weight
+
+        return (
+            (revenue_gas / supply_gas) * variable_weight_gas,
+            (revenue_elec / supply_elec) * variable_weight_elec,
+            (revenue_gas / customers_gas) * fixed_weight_gas,
+            (revenue_elec / customers_elec) * fixed_weight_elec,
+            revenue_tax,
+        )
+
     @staticmethod
     def _is_revenue_maintained(
         new_levy_var_gas: float,
@@ -488,16 +537,12 @@ BuyOutPriceSchemeYear, BuyOutPricePreviousYear, ForecastAnnualRPIPreviousYear fi
             raise ValueError("Please provide either revenue or denominator.")
 
         # get latest ro values from df
-        latest = (
-            df.loc[lambda df: df["ObligationLevel"].notna()]
-            .sort_values("UpdateDate", ascending=False)
-            .iloc[0]
-        )
+        latest = _latest_record(df, df["ObligationLevel"].notna(), "UpdateDate")
 
         ro_levy = cls.calculate_renewable_obligation_rate(
-            latest.ObligationLevel,
-            latest.BuyOutPriceSchemeYear,
-            latest.BuyOutPricePreviousYear,
+            latest["ObligationLevel"],
+            latest["BuyOutPriceSchemeYear"],
+            latest["BuyOutPricePreviousYear"],
         )
 
         if not revenue:
@@ -519,12 +564,12 @@ BuyOutPriceSchemeYear, BuyOutPricePreviousYear, ForecastAnnualRPIPreviousYear fi
             gas_fixed_rate=0,
             general_taxation=0,
             revenue=revenue,
-            UpdateDate=latest.UpdateDate,
-            SchemeYear=latest.SchemeYear,
-            obligation_level=latest.ObligationLevel,
-            BuyOutPriceSchemeYear=latest.BuyOutPriceSchemeYear,
-            BuyOutPricePreviousYear=latest.BuyOutPricePreviousYear,
-            ForecastAnnualRPIPreviousYear=latest.ForecastAnnualRPIPreviousYear,
+            UpdateDate=latest["UpdateDate"],
+            SchemeYear=latest["SchemeYear"],
+            obligation_level=latest["ObligationLevel"],
+            BuyOutPriceSchemeYear=latest["BuyOutPriceSchemeYear"],
+            BuyOutPricePreviousYear=latest["BuyOutPricePreviousYear"],
+            ForecastAnnualRPIPreviousYear=latest["ForecastAnnualRPIPreviousYear"],
         )
 
     @staticmethod
@@ -636,29 +681,18 @@ TariffPreviousYear, ForecastAnnualRPIPreviousYear fields.
             raise ValueError("Please provide either revenue or denominator.")
 
         # get latest aahedc values from df
-        latest = (
-            df.assign(
-                tariff=lambda df: df.apply(
-                    lambda x: (
-                        x["TariffCurrentYear"]
-                        if not np.isnan(x["TariffCurrentYear"])
-                        else x["TariffPreviousYear"]
-                    ),
-                    axis=1,
-                )
-            )
-            .loc[lambda df: df["tariff"].notna()]
-            .drop(columns="tariff")
-            .sort_values("UpdateDate", ascending=False)
-            .iloc[0]
+        latest = _latest_record(
+            df,
+            df["TariffCurrentYear"].fillna(df["TariffPreviousYear"]).notna(),
+            "UpdateDate",
         )
 
         aahedc_tariff_forecast = cls.calculate_aahedc_tariff_forecast(
-            latest.TariffPreviousYear, latest.ForecastAnnualRPIPreviousYear
+            latest["TariffPreviousYear"], latest["ForecastAnnualRPIPreviousYear"]
         )
 
         aahedc_levy = cls.calculate_aahedc_rate(
-            latest.TariffCurrentYear, aahedc_tariff_forecast
+            latest["TariffCurrentYear"], aahedc_tariff_forecast
         )
 
         if not revenue:
@@ -680,11 +714,11 @@ TariffPreviousYear, ForecastAnnualRPIPreviousYear fields.
             gas_fixed_rate=0,
             general_taxation=0,
             revenue=revenue,
-            UpdateDate=latest.UpdateDate,
-            SchemeYear=latest.SchemeYear,
-            TariffCurrentYear=latest.TariffCurrentYear,
-            TariffPreviousYear=latest.TariffPreviousYear,
-            ForecastAnnualRPIPreviousYear=latest.ForecastAnnualRPIPreviousYear,
+            UpdateDate=latest["UpdateDate"],
+            SchemeYear=latest["SchemeYear"],
+            TariffCurrentYear=latest["TariffCurrentYear"],
+            TariffPreviousYear=latest["TariffPreviousYear"],
+            ForecastAnnualRPIPreviousYear=latest["ForecastAnnualRPIPreviousYear"],
         )
 
     @staticmethod
@@ -699,11 +733,7 @@ TariffPreviousYear, ForecastAnnualRPIPreviousYear fields.
         TariffCurrentYear: float, aahedc_tariff_forecast: float
     ) -> float:
         """Calculate AAHEDC rate from given values."""
-        return (
-            TariffCurrentYear * 10
-            if not np.isnan(TariffCurrentYear)
-            else aahedc_tariff_forecast * 10
-        )
+        return np.nan_to_num(TariffCurrentYear, nan=aahedc_tariff_forecast) * 10
 
 
 class GGL(Levy):
@@ -796,13 +826,11 @@ or a denominator (number of meters) given to calculate it from the levy value (
             raise ValueError("Please provide either revenue or denominator.")
 
         # get latest ggl values from df
-        latest = (
-            df.loc[lambda df: df["LevyRate"].notna()]
-            .sort_values("UpdateDate", ascending=False)
-            .iloc[0]
-        )
+        latest = _latest_record(df, df["LevyRate"].notna(), "UpdateDate")
 
-        ggl_levy = cls.calculate_ggl_rate(latest.LevyRate, latest.BackdatedLevyRate)
+        ggl_levy = cls.calculate_ggl_rate(
+            latest["LevyRate"], latest["BackdatedLevyRate"]
+        )
 
         if not revenue:
             revenue = ggl_levy * denominator
@@ -823,20 +851,16 @@ or a denominator (number of meters) given to calculate it from the levy value (
             gas_fixed_rate=ggl_levy,
             general_taxation=0,
             revenue=revenue,
-            UpdateDate=latest.UpdateDate,
-            SchemeYear=latest.SchemeYear,
-            LevyRate=latest.LevyRate,
-            BackdatedLevyRate=latest.BackdatedLevyRate,
+            UpdateDate=latest["UpdateDate"],
+            SchemeYear=latest["SchemeYear"],
+            LevyRate=latest["LevyRate"],
+            BackdatedLevyRate=latest["BackdatedLevyRate"],
         )
 
     @staticmethod
     def calculate_ggl_rate(LevyRate: float, BackdatedLevyRate: float) -> float:
         """Calculate Green Gas Levy rate from given values."""
-        return (
-            (LevyRate * 365 / 100)
-            if np.isnan(BackdatedLevyRate)
-            else (LevyRate * 365 / 100) + (BackdatedLevyRate * 122 / 100)
-        )
+        return (LevyRate * 365 / 100) + (np.nan_to_num(BackdatedLevyRate) * 122 / 100)
 
 
 class WHD(Levy):
@@ -941,22 +965,20 @@ NoncoreSpending, ObligatedSuppliersCustomerBase, CompulsorySupplierFractionOfCor
             customers_elec: int [0, inf) annual electricity customers (customer or meter count).
         """
         # get latest whd values from df
-        latest = (
-            df.loc[lambda df: df["TargetSpendingForSchemeYear"].notna()]
-            .sort_values("UpdateDate", ascending=False)
-            .iloc[0]
+        latest = _latest_record(
+            df, df["TargetSpendingForSchemeYear"].notna(), "UpdateDate"
         )
 
         whd_levy = cls.calculate_whd_rate(
-            latest.TargetSpendingForSchemeYear,
-            latest.CoreSpending,
-            latest.NoncoreSpending,
-            latest.ObligatedSuppliersCustomerBase,
-            latest.CompulsorySupplierFractionOfCoreGroup,
+            latest["TargetSpendingForSchemeYear"],
+            latest["CoreSpending"],
+            latest["NoncoreSpending"],
+            latest["ObligatedSuppliersCustomerBase"],
+            latest["CompulsorySupplierFractionOfCoreGroup"],
         )
 
         if not revenue:
-            revenue = latest.TargetSpendingForSchemeYear
+            revenue = latest["TargetSpendingForSchemeYear"]
 
         if customers_gas and customers_elec:
             gas_weight = customers_gas / (customers_gas + customers_elec)
@@ -981,13 +1003,15 @@ NoncoreSpending, ObligatedSuppliersCustomerBase, CompulsorySupplierFractionOfCor
             gas_fixed_rate=whd_levy,
             general_taxation=0,
             revenue=revenue,
-            UpdateDate=latest.UpdateDate,
-            SchemeYear=latest.SchemeYear,
-            TargetSpendingForSchemeYear=latest.TargetSpendingForSchemeYear,
-            CoreSpending=latest.CoreSpending,
-            NoncoreSpending=latest.NoncoreSpending,
-            ObligatedSuppliersCustomerBase=latest.ObligatedSuppliersCustomerBase,
-            CompulsorySupplierFractionOfCoreGroup=latest.CompulsorySupplierFractionOfCoreGroup,
+            UpdateDate=latest["UpdateDate"],
+            SchemeYear=latest["SchemeYear"],
+            TargetSpendingForSchemeYear=latest["TargetSpendingForSchemeYear"],
+            CoreSpending=latest["CoreSpending"],
+            NoncoreSpending=latest["NoncoreSpending"],
+            ObligatedSuppliersCustomerBase=latest["ObligatedSuppliersCustomerBase"],
+            CompulsorySupplierFractionOfCoreGroup=latest[
+                "CompulsorySupplierFractionOfCoreGroup"
+            ],
         )
 
     @staticmethod
@@ -1134,36 +1158,32 @@ ObligatedSupplierVolumeElectricity, fields.
             revenue: float, a total revenue amount (£) for the levy.
         """
         # get latest eco values from df
-        latest = (
-            df.loc[lambda df: df["AnnualisedCostECO4Gas"].notna()]
-            .sort_values("UpdateDate", ascending=False)
-            .iloc[0]
-        )
+        latest = _latest_record(df, df["AnnualisedCostECO4Gas"].notna(), "UpdateDate")
 
         eco_levy_gas = cls.calculate_eco_rate(
-            latest.AnnualisedCostECO4Gas,
-            latest.AnnualisedCostGBISGas,
-            latest.GDPDeflatorToCurrentPricesECO4,
-            latest.GDPDeflatorToCurrentPricesGBIS,
-            latest.FullyObligatedShareOfObligatedSupplierSupplyGas,
-            latest.ObligatedSupplierVolumeGas,
+            latest["AnnualisedCostECO4Gas"],
+            latest["AnnualisedCostGBISGas"],
+            latest["GDPDeflatorToCurrentPricesECO4"],
+            latest["GDPDeflatorToCurrentPricesGBIS"],
+            latest["FullyObligatedShareOfObligatedSupplierSupplyGas"],
+            latest["ObligatedSupplierVolumeGas"],
         )
 
         eco_levy_elec = cls.calculate_eco_rate(
-            latest.AnnualisedCostECO4Electricity,
-            latest.AnnualisedCostGBISElectricity,
-            latest.GDPDeflatorToCurrentPricesECO4,
-            latest.GDPDeflatorToCurrentPricesGBIS,
-            latest.FullyObligatedShareOfObligatedSupplierSupplyElectricity,
-            latest.ObligatedSupplierVolumeElectricity,
+            latest["AnnualisedCostECO4Electricity"],
+            latest["AnnualisedCostGBISElectricity"],
+            latest["GDPDeflatorToCurrentPricesECO4"],
+            latest["GDPDeflatorToCurrentPricesGBIS"],
+            latest["FullyObligatedShareOfObligatedSupplierSupplyElectricity"],
+            latest["ObligatedSupplierVolumeElectricity"],
         )
 
         if not revenue:
             revenue = (
-                latest.AnnualisedCostECO4Gas
-                + latest.AnnualisedCostECO4Electricity
-                + latest.AnnualisedCostGBISGas
-                + latest.AnnualisedCostGBISElectricity
+                latest["AnnualisedCostECO4Gas"]
+                + latest["AnnualisedCostECO4Electricity"]
+                + latest["AnnualisedCostGBISGas"]
+                + latest["AnnualisedCostGBISElectricity"]
             )
 
         return cls(
@@ -1182,18 +1202,24 @@ ObligatedSupplierVolumeElectricity, fields.
             gas_fixed_rate=0,
             general_taxation=0,
             revenue=revenue,
-            UpdateDate=latest.UpdateDate,
-            SchemeYear=latest.SchemeYear,
-            AnnualisedCostECO4Gas=latest.AnnualisedCostECO4Gas,
-            AnnualisedCostECO4Electricity=latest.AnnualisedCostECO4Electricity,
-            AnnualisedCostGBISGas=latest.AnnualisedCostGBISGas,
-            AnnualisedCostGBISElectricity=latest.AnnualisedCostGBISElectricity,
-            GDPDeflatorToCurrentPricesECO4=latest.GDPDeflatorToCurrentPricesECO4,
-            GDPDeflatorToCurrentPricesGBIS=latest.GDPDeflatorToCurrentPricesGBIS,
-            FullyObligatedShareOfObligatedSupplierSupplyGas=latest.FullyObligatedShareOfObligatedSupplierSupplyGas,
-            FullyObligatedShareOfObligatedSupplierSupplyElectricity=latest.FullyObligatedShareOfObligatedSupplierSupplyElectricity,
-            ObligatedSupplierVolumeGas=latest.ObligatedSupplierVolumeGas,
-            ObligatedSupplierVolumeElectricity=latest.ObligatedSupplierVolumeElectricity,
+            UpdateDate=latest["UpdateDate"],
+            SchemeYear=latest["SchemeYear"],
+            AnnualisedCostECO4Gas=latest["AnnualisedCostECO4Gas"],
+            AnnualisedCostECO4Electricity=latest["AnnualisedCostECO4Electricity"],
+            AnnualisedCostGBISGas=latest["AnnualisedCostGBISGas"],
+            AnnualisedCostGBISElectricity=latest["AnnualisedCostGBISElectricity"],
+            GDPDeflatorToCurrentPricesECO4=latest["GDPDeflatorToCurrentPricesECO4"],
+            GDPDeflatorToCurrentPricesGBIS=latest["GDPDeflatorToCurrentPricesGBIS"],
+            FullyObligatedShareOfObligatedSupplierSupplyGas=latest[
+                "FullyObligatedShareOfObligatedSupplierSupplyGas"
+            ],
+            FullyObligatedShareOfObligatedSupplierSupplyElectricity=latest[
+                "FullyObligatedShareOfObligatedSupplierSupplyElectricity"
+            ],
+            ObligatedSupplierVolumeGas=latest["ObligatedSupplierVolumeGas"],
+            ObligatedSupplierVolumeElectricity=latest[
+                "ObligatedSupplierVolumeElectricity"
+            ],
         )
 
     @staticmethod
@@ -1326,21 +1352,19 @@ ExemptSupplyEII, ChargeRestrictionPeriod2_start, ChargeRestrictionPeriod2_end fi
             revenue: float, a total revenue amount (£) for the levy.
         """
         # get latest fit values from df
-        latest = (
-            df.loc[lambda df: df["TotalElectricitySupplied"].notna()]
-            .sort_values("ChargeRestrictionPeriod2_start", ascending=False)
-            .iloc[0]
+        latest = _latest_record(
+            df, df["TotalElectricitySupplied"].notna(), "ChargeRestrictionPeriod2_start"
         )
 
         fit_levy = cls.calculate_feed_in_tariff_rate(
-            latest.InflatedLevelisationFund,
-            latest.TotalElectricitySupplied,
-            latest.ExemptSupplyOutsideUK,
-            latest.ExemptSupplyEII,
+            latest["InflatedLevelisationFund"],
+            latest["TotalElectricitySupplied"],
+            latest["ExemptSupplyOutsideUK"],
+            latest["ExemptSupplyEII"],
         )
 
         if not revenue:
-            revenue = latest.InflatedLevelisationFund
+            revenue = latest["InflatedLevelisationFund"]
 
         return cls(
             name="Feed in Tariff",
@@ -1358,13 +1382,13 @@ ExemptSupplyEII, ChargeRestrictionPeriod2_start, ChargeRestrictionPeriod2_end fi
             gas_fixed_rate=0,
             general_taxation=0,
             revenue=revenue,
-            ChargeRestrictionPeriod1=latest.ChargeRestrictionPeriod1,
-            ChargeRestrictionPeriod2=latest.ChargeRestrictionPeriod2,
-            LookupPeriod=latest.LookupPeriod,
-            InflatedLevelisationFund=latest.InflatedLevelisationFund,
-            TotalElectricitySupplied=latest.TotalElectricitySupplied,
-            ExemptSupplyOutsideUK=latest.ExemptSupplyOutsideUK,
-            ExemptSupplyEII=latest.ExemptSupplyEII,
+            ChargeRestrictionPeriod1=latest["ChargeRestrictionPeriod1"],
+            ChargeRestrictionPeriod2=latest["ChargeRestrictionPeriod2"],
+            LookupPeriod=latest["LookupPeriod"],
+            InflatedLevelisationFund=latest["InflatedLevelisationFund"],
+            TotalElectricitySupplied=latest["TotalElectricitySupplied"],
+            ExemptSupplyOutsideUK=latest["ExemptSupplyOutsideUK"],
+            ExemptSupplyEII=latest["ExemptSupplyEII"],
         )
 
     @staticmethod
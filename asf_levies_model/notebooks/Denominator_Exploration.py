@@ -18,8 +18,6 @@
 import pandas
 import matplotlib.pyplot as pyplot
 from matplotlib.lines import Line2D
-from datetime import timedelta
-from dateutil.relativedelta import relativedelta
 
 # %% [markdown]
 # ## Datasets
@@ -138,11 +136,12 @@ eco = pandas.concat([periods, gas, electricity], axis=1).assign(
             1
         ],
         format="%B %Y",
-    ).apply(lambda date: date + relativedelta(months=+1) + relativedelta(days=-1)),
+    )
+    + pandas.offsets.MonthEnd(0),
 )
 
 # %%
-f, (ax1, ax2) = pyplot.subplots(1, 2, figsize=(14, 5))
+f, (ax1, ax2) = pyplot.subplots(1, 2, figsize=(14, 5), sharex=True)
 
 # ax1 reported supply volumes
 ax1.bar(
@@ -171,11 +170,11 @@ ax1.set_ylabel("Supply Volume, MWh Supplied")
 ax1.legend(loc=4)
 
 # ax2 supply ratio
-eco["share"] = eco[
-    "Supply volumes of obligated suppliers - electricity (MWh supplied)"
-] / (
-    eco["Supply volumes of obligated suppliers - electricity (MWh supplied)"]
-    + eco["Supply volumes of obligated suppliers - gas (MWh supplied)"]
+eco.eval(
+    "share = `Supply volumes of obligated suppliers - electricity (MWh supplied)`"
+    " / (`Supply volumes of obligated suppliers - electricity (MWh supplied)`"
+    " + `Supply volumes of obligated suppliers - gas (MWh supplied)`)",
+    inplace=True,
 )
 
 line_share = Line2D(
@@ -185,9 +184,6 @@ line_share = Line2D(
 
 ax2.add_line(line_share)
 
-ax2.set_xlim(ax1.get_xlim())
-ax2.set_xticks(ax1.get_xticks())
-ax2.set_xticklabels(ax1.get_xticklabels())
 ax2.set_ylim([0, 0.5])
 ax2.grid()
 ax2.set_xlabel("Year")
@@ -388,8 +384,12 @@ total_gas = pandas.Series(
 )
 
 # %%
-desnz = pandas.concat(
-    [res_gas, res_elec, total_gas, total_elec], levels=year, axis=1
+desnz = pandas.DataFrame(
+    {
+        series.name: series.to_numpy()
+        for series in [res_gas, res_elec, total_gas, total_elec]
+    },
+    index=year,
 ).assign(
     **{
         "Residential Natural Gas, MWh": lambda df: df["Residential Natural Gas, ktoe"]
@@ -400,7 +400,6 @@ desnz = pandas.concat(
         "Total Electricity, MWh": lambda df: df["Total Electricity, ktoe"] * 11630,
     }
 )
-desnz.index = year
 
 # %%
 f, (ax1, ax2) = pyplot.subplots(1, 2, figsize=(12, 5))
@@ -438,11 +437,12 @@ ax1.legend()
 ax1.set_ylim([0, desnz["Total Natural Gas, MWh"].max() + 50_000_000])
 
 # ax2
-desnz["res_share"] = desnz["Residential Electricity, MWh"] / (
-    desnz["Residential Natural Gas, MWh"] + desnz["Residential Electricity, MWh"]
-)
-desnz["total_share"] = desnz["Total Electricity, MWh"] / (
-    desnz["Total Natural Gas, MWh"] + desnz["Total Electricity, MWh"]
+desnz.eval(
+    "res_share = `Residential Electricity, MWh`"
+    " / (`Residential Natural Gas, MWh` + `Residential Electricity, MWh`)\n"
+    "total_share = `Total Electricity, MWh`"
+    " / (`Total Natural Gas, MWh` + `Total Electricity, MWh`)",
+    inplace=True,
 )
 
 ax2.plot(
@@ -666,12 +666,13 @@ ax1.legend()
 ax1.set_ylim([0, dukes["UK Total Final Gas Consumption, MWh"].max() + 50_000_000])
 
 # ax2
-dukes["res_share"] = dukes["UK Domestic Electricity Consumption, MWh"] / (
-    dukes["UK Domestic Gas Consumption, MWh"]
-    + dukes["UK Domestic Electricity Consumption, MWh"]
-)
-dukes["total_share"] = dukes["UK Electricity Sales, MWh"] / (
-    dukes["UK Total Final Gas Consumption, MWh"] + dukes["UK Electricity Sales, MWh"]
+dukes.eval(
+    "res_share = `UK Domestic Electricity Consumption, MWh`"
+    " / (`UK Domestic Gas Consumption, MWh`"
+    " + `UK Domestic Electricity Consumption, MWh`)\n"
+    "total_share = `UK Electricity Sales, MWh`"
+    " / (`UK Total Final Gas Consumption, MWh` + `UK Electricity Sales, MWh`)",
+    inplace=True,
 )
 
 ax2.plot(
@@ -835,13 +836,13 @@ ax1.legend()
 ax1.set_ylim([0, subnat["Total Gas Consumption, GB MWh"].max() + 50_000_000])
 
 # ax2
-subnat["res_share"] = subnat["Domestic Electricity Consumption, GB MWh"] / (
-    subnat["Domestic Gas Consumption, GB MWh"]
-    + subnat["Domestic Electricity Consumption, GB MWh"]
-)
-subnat["total_share"] = subnat["Total Electricity Consumption, GB MWh"] / (
-    subnat["Total Gas Consumption, GB MWh"]
-    + subnat["Total Electricity Consumption, GB MWh"]
+subnat.eval(
+    "res_share = `Domestic Electricity Consumption, GB MWh`"
+    " / (`Domestic Gas Consumption, GB MWh`"
+    " + `Domestic Electricity Consumption, GB MWh`)\n"
+    "total_share = `Total Electricity Consumption, GB MWh`"
+    " / (`Total Gas Consumption, GB MWh` + `Total Electricity Consumption, GB MWh`)",
+    inplace=True,
 )
 
 ax2.plot(
@@ -940,7 +941,8 @@ whd = pandas.concat([periods, customers], axis=1).assign(
             1
         ],
         format="%B %Y",
-    ).apply(lambda date: date + relativedelta(months=+1) + relativedelta(days=-1)),
+    )
+    + pandas.offsets.MonthEnd(0),
 )
 
 # %%
@@ -1124,11 +1126,12 @@ ax1.legend()
 ax1.set_ylim([0, subnat_meters["Total Electricity Meters"].max() + 5_000_000])
 
 # ax2
-subnat_meters["res_share"] = subnat_meters["Domestic Electricity Meters"] / (
-    subnat_meters["Domestic Gas Meters"] + subnat_meters["Domestic Electricity Meters"]
-)
-subnat_meters["total_share"] = subnat_meters["Total Electricity Meters"] / (
-    subnat_meters["Total Gas Meters"] + subnat_meters["Total Electricity Meters"]
+subnat_meters.eval(
+    "res_share = `Domestic Electricity Meters`"
+    " / (`Domestic Gas Meters` + `Domestic Electricity Meters`)\n"
+    "total_share = `Total Electricity Meters`"
+    " / (`Total Gas Meters` + `Total Electricity Meters`)",
+    inplace=True,
 )
 
 ax2.plot(
@@ -23,7 +23,14 @@
 
 
 # %%
+BASES = frozenset(["variable", "fixed", "taxation"])
+FUELS = frozenset(["gas", "electricity"])
+COST_BASIS_UNITS = {"variable": "£/MWh", "fixed": "£/customer", "taxation": ""}
+
+
 class Levy:
+    __slots__ = ("name", "_basis", "_fuel", "cost")
+
     def __init__(self, name, basis, fuel, cost):
         self.name = name
         self.basis = basis
@@ -36,7 +43,7 @@ class Levy:
 
     @basis.setter
     def basis(self, value):
-        if not value in ["variable", "fixed", "taxation"]:
+        if value not in BASES:
             raise ValueError(
                 "basis expected to be one of: ['variable', 'fixed', 'taxation']"
             )
@@ -48,7 +55,7 @@ class Levy:
 
     @fuel.setter
     def fuel(self, value):
-        if not value in ["gas", "electricity"]:
+        if value not in FUELS:
             raise ValueError("fuel expected to be one of: ['gas', 'electricity']")
         self._fuel = value
 
@@ -75,8 +82,7 @@ class Levy:
         return f"{self.name}"
 
     def __repr__(self):
-        cost_basis = {"variable": "£/MWh", "fixed": "£/customer", "taxation": ""}
-        return f'{type(self).__name__}(name="{self.name}", basis="{self.basis}", fuel="{self.fuel}", cost={self.cost} {cost_basis[self.basis]})'
+        return f'{type(self).__name__}(name="{self.name}", basis="{self.basis}", fuel="{self.fuel}", cost={self.cost} {COST_BASIS_UNITS[self.basis]})'
 
 
 # %%
@@ -114,36 +120,42 @@ TYPICAL_CONSUMPTION_GAS = 11.5
 
 
 # %%
+import numpy as np
+
+
 def calculate_policy_costs(
     levies: list[Levy],
     electricity_consumption: float = TYPICAL_CONSUMPTION_ELECTRICITY,
     gas_consumption: float = TYPICAL_CONSUMPTION_GAS,
-) -> float:
+) -> dict:
     """Calculate policy costs for a given collection of levies."""
-    policy_cost = {
-        "gas": 0,
-        "electricity": 0,
-        "gas_nil": 0,
-        "electricity_nil": 0,
-        "gas_variable": 0,
-        "electricity_variable": 0,
-        "gas_variable_unit": 0,
-        "electricity_variable_unit": 0,
+    # Hold levies as parallel arrays so each total is a single masked sum
+    cost = np.array([levy.cost for levy in levies], dtype=float)
+    fuel = np.array([levy.fuel for levy in levies])
+    basis = np.array([levy.basis for levy in levies])
+
+    nil = {
+        f: float(cost[(fuel == f) & (basis == "fixed")].sum())
+        for f in ["gas", "electricity"]
+    }
+    variable_unit = {
+        f: float(cost[(fuel == f) & (basis == "variable")].sum())
+        for f in ["gas", "electricity"]
+    }
+    variable = {
+        "gas": variable_unit["gas"] * gas_consumption,
+        "electricity": variable_unit["electricity"] * electricity_consumption,
+    }
+    return {
+        "gas": nil["gas"] + variable["gas"],
+        "electricity": nil["electricity"] + variable["electricity"],
+        "gas_nil": nil["gas"],
+        "electricity_nil": nil["electricity"],
+        "gas_variable": variable["gas"],
+        "electricity_variable": variable["electricity"],
+        "gas_variable_unit": variable_unit["gas"],
+        "electricity_variable_unit": variable_unit["electricity"],
     }
-    consumption = {"electricity": electricity_consumption, "gas": gas_consumption}
-    for levy in levies:
-        if levy.basis == "fixed":
-            policy_cost[levy.fuel] += levy.calculate_fixed_cost()
-            policy_cost[f"{levy.fuel}_nil"] += levy.calculate_fixed_cost()
-        elif levy.basis == "variable":
-            policy_cost[levy.fuel] += levy.calculate_variable_cost(
-                consumption[levy.fuel]
-            )
-            policy_cost[f"{levy.fuel}_variable"] += levy.calculate_variable_cost(
-                consumption[levy.fuel]
-            )
-            policy_cost[f"{levy.fuel}_variable_unit"] += levy.cost
-    return policy_cost
 
 
 # %%
@@ -155,6 +167,35 @@ policy_costs
 
 # %%
 class Tariff:
+    __slots__ = (
+        "name",
+        "fuel",
+        "df_nil",
+        "cm_nil",
+        "aa_nil",
+        "pc_nil",
+        "nc_nil",
+        "oc_nil",
+        "smncc_nil",
+        "paac_nil",
+        "pap_nil",
+        "ebit_nil",
+        "hap_nil",
+        "levelisation_nil",
+        "df",
+        "cm",
+        "aa",
+        "pc",
+        "nc",
+        "oc",
+        "smncc",
+        "paac",
+        "pap",
+        "ebit",
+        "hap",
+        "levelisation",
+    )
+
     def __init__(
         self,
         name,
@@ -234,25 +275,23 @@ class Tariff:
         )
 
     def calculate_variable_consumption(self, consumption):
-        return sum(
-            [
-                component * consumption
-                for component in [
-                    self.df,
-                    self.cm,
-                    self.aa,
-                    self.pc,
-                    self.nc,
-                    self.oc,
-                    self.smncc,
-                    self.paac,
-                    self.pap,
-                    self.ebit,
-                    self.hap,
-                    self.levelisation,
-                ]
-                if component is not None
+        return consumption * sum(
+            component
+            for component in [
+                self.df,
+                self.cm,
+                self.aa,
+                self.pc,
+                self.nc,
+                self.oc,
+                self.smncc,
+                self.paac,
+                self.pap,
+                self.ebit,
+                self.hap,
+                self.levelisation,
             ]
+            if component is not None
         )
 
     def calculate_total_consumption(self, consumption, vat=False):
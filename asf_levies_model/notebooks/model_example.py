@@ -16,6 +16,8 @@
 # ---
 
 # %%
+from types import MappingProxyType
+
 from asf_levies_model.getters.load_data import (
     download_annex_4,
     process_data_RO,
@@ -41,6 +43,8 @@ from asf_levies_model.getters.load_data import (
 
 from asf_levies_model.levies import RO, AAHEDC, GGL, WHD, ECO, FIT
 
+from asf_levies_model.summary import calculate_tariff_policy_costs
+
 from asf_levies_model.tariffs import (
     ElectricityStandardCredit,
     GasStandardCredit,
@@ -58,18 +62,29 @@ from asf_levies_model.tariffs import (
 url = "https://www.ofgem.gov.uk/sites/default/files/2024-08/Annex_4_-_Policy_cost_allowance_methodology_v1.19%20%281%29.xlsx"
 download_annex_4(url)
 
+# %%
+# Domestic supply and customer numbers from subnational consumption estimates
+domestic_values = MappingProxyType(
+    {
+        "supply_elec": 94_200_366,
+        "supply_gas": 265_197_947,
+        "customers_gas": 24_503_683,
+        "customers_elec": 29_078_770,
+    }
+)
+
 # %%
 # Initialise the existing levies
 
 levies = [
     RO.from_dataframe(
-        process_data_RO(), denominator=94_200_366
+        process_data_RO(), denominator=domestic_values["supply_elec"]
     ),  # domestic denominator
     AAHEDC.from_dataframe(
-        process_data_AAHEDC(), denominator=94_200_366
+        process_data_AAHEDC(), denominator=domestic_values["supply_elec"]
     ),  # domestic denominator
     GGL.from_dataframe(
-        process_data_GGL(), denominator=24_503_683
+        process_data_GGL(), denominator=domestic_values["customers_gas"]
     ),  # domestic denominator
     WHD.from_dataframe(process_data_WHD()),  # domestic only levy
     ECO.from_dataframe(process_data_ECO()),  # domestic only levy
@@ -81,7 +96,7 @@ levies = [
 
 # %%
 # get sum of policy costs for typical consumption
-sum([levy.calculate_levy(2.7, 11.5, True, True) for levy in levies])
+sum(levy.calculate_levy(2.7, 11.5, True, True) for levy in levies)
 
 # %%
 # deonminators from subnational consumption estimates
@@ -97,131 +112,78 @@ denominators = {'ro': {'supply_elec':250_020_739, 'supply_gas':435_369_123, 'cus
 """
 
 # Using just domestic values for rebalancing
-denominators = {
-    "ro": {
-        "supply_elec": 94_200_366,
-        "supply_gas": 265_197_947,
-        "customers_gas": 24_503_683,
-        "customers_elec": 29_078_770,
-    },
-    "aahedc": {
-        "supply_elec": 94_200_366,
-        "supply_gas": 265_197_947,
-        "customers_gas": 24_503_683,
-        "customers_elec": 29_078_770,
+denominators = dict.fromkeys(
+    ("ro", "aahedc", "ggl", "whd", "eco", "fit"), domestic_values
+)
+
+# %%
+# rebalancing scenarios
+rebalancing_weights = {
+    "electricity variable": {
+        "new_electricity_weight": 1,
+        "new_gas_weight": 0,
+        "new_tax_weight": 0,
+        "new_variable_weight_elec": 1,
+        "new_fixed_weight_elec": 0,
+        "new_variable_weight_gas": 0,
+        "new_fixed_weight_gas": 0,
     },
-    "ggl": {
-        "supply_elec": 94_200_366,
-        "supply_gas": 265_197_947,
-        "customers_gas": 24_503_683,
-        "customers_elec": 29_078_770,
+    "gas variable": {
+        "new_electricity_weight": 0,
+        "new_gas_weight": 1,
+        "new_tax_weight": 0,
+        "new_variable_weight_elec": 0,
+        "new_fixed_weight_elec": 0,
+        "new_variable_weight_gas": 1,
+        "new_fixed_weight_gas": 0,
     },
-    "whd": {
-        "supply_elec": 94_200_366,
-        "supply_gas": 265_197_947,
-        "customers_gas": 24_503_683,
-        "customers_elec": 29_078_770,
+    "electricity fixed": {
+        "new_electricity_weight": 1,
+        "new_gas_weight": 0,
+        "new_tax_weight": 0,
+        "new_variable_weight_elec": 0,
+        "new_fixed_weight_elec": 1,
+        "new_variable_weight_gas": 0,
+        "new_fixed_weight_gas": 0,
     },
-    "eco": {
-        "supply_elec": 94_200_366,
-        "supply_gas": 265_197_947,
-        "customers_gas": 24_503_683,
-        "customers_elec": 29_078_770,
-    },
-    "fit": {
-        "supply_elec": 94_200_366,
-        "supply_gas": 265_197_947,
-        "customers_gas": 24_503_683,
-        "customers_elec": 29_078_770,
+    "gas fixed": {
+        "new_electricity_weight": 0,
+        "new_gas_weight": 1,
+        "new_tax_weight": 0,
+        "new_variable_weight_elec": 0,
+        "new_fixed_weight_elec": 0,
+        "new_variable_weight_gas": 0,
+        "new_fixed_weight_gas": 1,
     },
 }
 
-# %%
 # rebalance
-rebalance_electricity_variable = {
-    "new_electricity_weight": 1,
-    "new_gas_weight": 0,
-    "new_tax_weight": 0,
-    "new_variable_weight_elec": 1,
-    "new_fixed_weight_elec": 0,
-    "new_variable_weight_gas": 0,
-    "new_fixed_weight_gas": 0,
+rebalanced_levies = {
+    scenario: [
+        levy.rebalance_levy(**weights, **denominators[levy.short_name])
+        for levy in levies
+    ]
+    for scenario, weights in rebalancing_weights.items()
 }
 
-elec_var_levies = [
-    levy.rebalance_levy(
-        **rebalance_electricity_variable, **denominators[levy.short_name]
-    )
-    for levy in levies
-]
-
 # %%
-# get sum of new policy costs
-sum([levy.calculate_levy(2.7, 11.5, True, True) for levy in elec_var_levies])
-
-# %%
-# rebalance
-rebalance_gas_variable = {
-    "new_electricity_weight": 0,
-    "new_gas_weight": 1,
-    "new_tax_weight": 0,
-    "new_variable_weight_elec": 0,
-    "new_fixed_weight_elec": 0,
-    "new_variable_weight_gas": 1,
-    "new_fixed_weight_gas": 0,
+# electricity and gas consumption (MWh) at which each scenario is summarised
+summary_consumption = {
+    "electricity variable": (2.7, 11.5),
+    "gas variable": (2.7, 11.5),
+    "electricity fixed": (4.684, 18.53),
+    "gas fixed": (2.7, 11.5),
 }
 
-gas_var_levies = [
-    levy.rebalance_levy(**rebalance_gas_variable, **denominators[levy.short_name])
-    for levy in levies
-]
-
-# %%
 # get sum of new policy costs
-sum([levy.calculate_levy(2.7, 11.5, True, True) for levy in gas_var_levies])
-
-# %%
-# rebalance
-rebalance_electricity_fixed = {
-    "new_electricity_weight": 1,
-    "new_gas_weight": 0,
-    "new_tax_weight": 0,
-    "new_variable_weight_elec": 0,
-    "new_fixed_weight_elec": 1,
-    "new_variable_weight_gas": 0,
-    "new_fixed_weight_gas": 0,
-}
-
-elec_fixed_levies = [
-    levy.rebalance_levy(**rebalance_electricity_fixed, **denominators[levy.short_name])
-    for levy in levies
-]
-
-# %%
-# get sum of new policy costs
-sum([levy.calculate_levy(4.684, 18.53, True, True) for levy in elec_fixed_levies])
-
-# %%
-# rebalance
-rebalance_gas_fixed = {
-    "new_electricity_weight": 0,
-    "new_gas_weight": 1,
-    "new_tax_weight": 0,
-    "new_variable_weight_elec": 0,
-    "new_fixed_weight_elec": 0,
-    "new_variable_weight_gas": 0,
-    "new_fixed_weight_gas": 1,
+{
+    scenario: sum(
+        levy.calculate_levy(*summary_consumption[scenario], True, True)
+        for levy in new_levies
+    )
+    for scenario, new_levies in rebalanced_levies.items()
 }
 
-gas_fixed_levies = [
-    levy.rebalance_levy(**rebalance_gas_fixed, **denominators[levy.short_name])
-    for levy in levies
-]
-
-# %%
-# get sum of new policy costs
-sum([levy.calculate_levy(2.7, 11.5, True, True) for levy in gas_fixed_levies])
-
 # %% [markdown]
 # ### Bill Costs
 
@@ -255,8 +217,8 @@ elec_bill.calculate_total_consumption(2.7)
 # In theory we can update the pc_nil and pc attributes with relevant costs.
 # Let's use the defaults and check it works!
 
-elec_bill.pc_nil = sum([levy.calculate_fixed_levy(True, False) for levy in levies])
-elec_bill.pc = sum([levy.calculate_variable_levy(1, 0) for levy in levies])
+policy_costs = calculate_tariff_policy_costs(levies)
+elec_bill.pc_nil, elec_bill.pc = policy_costs["electricity"]
 
 # %%
 # Now recalculate - there's a 10p difference, which comes from variable costs - rounding?
@@ -282,8 +244,7 @@ gas_bill.calculate_total_consumption(11.5)
 # %%
 # Let's use the defaults and check it works!
 
-gas_bill.pc_nil = sum([levy.calculate_fixed_levy(False, True) for levy in levies])
-gas_bill.pc = sum([levy.calculate_variable_levy(0, 1) for levy in levies])
+gas_bill.pc_nil, gas_bill.pc = policy_costs["gas"]
 
 # %%
 # Check it works - its the same!
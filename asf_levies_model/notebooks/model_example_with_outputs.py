@@ -1,4 +1,7 @@
 # %%
+from types import MappingProxyType
+
+import numpy as np
 import pandas as pd
 
 from asf_levies_model.getters.load_data import (
@@ -21,17 +24,28 @@ from asf_levies_model.summary import process_rebalancing_scenarios
 url = "https://www.ofgem.gov.uk/sites/default/files/2024-08/Annex_4_-_Policy_cost_allowance_methodology_v1.19 (1).xlsx"
 download_annex_4(url)
 
+# %%
+# Domestic supply and customer numbers from subnational consumption estimates
+domestic_values = MappingProxyType(
+    {
+        "supply_elec": 94_200_366,
+        "supply_gas": 265_197_947,
+        "customers_gas": 24_503_683,
+        "customers_elec": 29_078_770,
+    }
+)
+
 # %%
 # Initialise the existing levies
 levies = [
     RO.from_dataframe(
-        process_data_RO(), denominator=94_200_366
+        process_data_RO(), denominator=domestic_values["supply_elec"]
     ),  # domestic denominator
     AAHEDC.from_dataframe(
-        process_data_AAHEDC(), denominator=94_200_366
+        process_data_AAHEDC(), denominator=domestic_values["supply_elec"]
     ),  # domestic denominator
     GGL.from_dataframe(
-        process_data_GGL(), denominator=24_503_683
+        process_data_GGL(), denominator=domestic_values["customers_gas"]
     ),  # domestic denominator
     WHD.from_dataframe(process_data_WHD()),  # domestic only levy
     ECO.from_dataframe(process_data_ECO()),  # domestic only levy
@@ -55,52 +69,41 @@ denominators = {'ro': {'supply_elec':250_020_739, 'supply_gas':435_369_123, 'cus
 """
 
 # Using just domestic values for rebalancing
-domestic_values = {
-    "supply_elec": 94_200_366,
-    "supply_gas": 265_197_947,
-    "customers_gas": 24_503_683,
-    "customers_elec": 29_078_770,
-}
-
-denominators = {
-    key: domestic_values for key in ["ro", "aahedc", "ggl", "whd", "eco", "fit"]
-}
+levy_names = ("ro", "aahedc", "ggl", "whd", "eco", "fit")
+denominators = dict.fromkeys(levy_names, domestic_values)
 
 # %%
 # Annual consumption profiles
-consumption_values_df = pd.concat(
-    [
-        pd.Series(
-            [
-                "Typical",
-                "A1",
-                "A2",
-                "A3",
-                "B4",
-                "B5",
-                "B6",
-                "C7",
-                "C8",
-                "C9",
-                "D10",
-                "D11",
-                "D12",
-                "E13",
-                "E14",
-                "F15",
-                "F16",
-                "G17",
-                "G18",
-                "H19",
-                "H20",
-                "I21",
-                "I22",
-                "J23",
-                "J24",
-            ],
-            name="AnnualConsumptionProfile",
-        ),
-        pd.Series(
+consumption_values_df = pd.DataFrame(
+    {
+        "AnnualConsumptionProfile": [
+            "Typical",
+            "A1",
+            "A2",
+            "A3",
+            "B4",
+            "B5",
+            "B6",
+            "C7",
+            "C8",
+            "C9",
+            "D10",
+            "D11",
+            "D12",
+            "E13",
+            "E14",
+            "F15",
+            "F16",
+            "G17",
+            "G18",
+            "H19",
+            "H20",
+            "I21",
+            "I22",
+            "J23",
+            "J24",
+        ],
+        "ElectricitySingleRatekWh": np.array(
             [
                 2700.0,
                 2742.0,
@@ -128,9 +131,9 @@ consumption_values_df = pd.concat(
                 4532.0,
                 7523.0,
             ],
-            name="ElectricitySingleRatekWh",
+            dtype=np.float64,
         ),
-        pd.Series(
+        "GaskWh": np.array(
             [
                 11500.0,
                 10933.0,
@@ -158,69 +161,67 @@ consumption_values_df = pd.concat(
                 16330.0,
                 0.0,
             ],
-            name="GaskWh",
+            dtype=np.float64,
         ),
-    ],
-    axis=1,
+    }
 )
 
 # %%
-electricity_variable_weights = {
-    "new_electricity_weight": 1,
-    "new_gas_weight": 0,
-    "new_tax_weight": 0,
-    "new_variable_weight_elec": 1,
-    "new_fixed_weight_elec": 0,
-    "new_variable_weight_gas": 0,
-    "new_fixed_weight_gas": 0,
-}
+electricity_variable_weights = MappingProxyType(
+    {
+        "new_electricity_weight": 1,
+        "new_gas_weight": 0,
+        "new_tax_weight": 0,
+        "new_variable_weight_elec": 1,
+        "new_fixed_weight_elec": 0,
+        "new_variable_weight_gas": 0,
+        "new_fixed_weight_gas": 0,
+    }
+)
 
-electricity_fixed_weights = {
-    "new_electricity_weight": 1,
-    "new_gas_weight": 0,
-    "new_tax_weight": 0,
-    "new_variable_weight_elec": 0,
-    "new_fixed_weight_elec": 1,
-    "new_variable_weight_gas": 0,
-    "new_fixed_weight_gas": 0,
-}
+electricity_fixed_weights = MappingProxyType(
+    {
+        "new_electricity_weight": 1,
+        "new_gas_weight": 0,
+        "new_tax_weight": 0,
+        "new_variable_weight_elec": 0,
+        "new_fixed_weight_elec": 1,
+        "new_variable_weight_gas": 0,
+        "new_fixed_weight_gas": 0,
+    }
+)
 
-gas_variable_weights = {
-    "new_electricity_weight": 0,
-    "new_gas_weight": 1,
-    "new_tax_weight": 0,
-    "new_variable_weight_elec": 0,
-    "new_fixed_weight_elec": 0,
-    "new_variable_weight_gas": 1,
-    "new_fixed_weight_gas": 0,
-}
+gas_variable_weights = MappingProxyType(
+    {
+        "new_electricity_weight": 0,
+        "new_gas_weight": 1,
+        "new_tax_weight": 0,
+        "new_variable_weight_elec": 0,
+        "new_fixed_weight_elec": 0,
+        "new_variable_weight_gas": 1,
+        "new_fixed_weight_gas": 0,
+    }
+)
 
-gas_fixed_weights = {
-    "new_electricity_weight": 0,
-    "new_gas_weight": 1,
-    "new_tax_weight": 0,
-    "new_variable_weight_elec": 0,
-    "new_fixed_weight_elec": 0,
-    "new_variable_weight_gas": 0,
-    "new_fixed_weight_gas": 1,
-}
+gas_fixed_weights = MappingProxyType(
+    {
+        "new_electricity_weight": 0,
+        "new_gas_weight": 1,
+        "new_tax_weight": 0,
+        "new_variable_weight_elec": 0,
+        "new_fixed_weight_elec": 0,
+        "new_variable_weight_gas": 0,
+        "new_fixed_weight_gas": 1,
+    }
+)
 
 weights = {
-    "100% Electricity Variable": {
-        key: electricity_variable_weights
-        for key in ["ro", "aahedc", "ggl", "whd", "eco", "fit"]
-    },
-    "100% Electricity Fixed": {
-        key: electricity_fixed_weights
-        for key in ["ro", "aahedc", "ggl", "whd", "eco", "fit"]
-    },
-    "100% Gas Variable": {
-        key: gas_variable_weights
-        for key in ["ro", "aahedc", "ggl", "whd", "eco", "fit"]
-    },
-    "100% Gas Fixed": {
-        key: gas_fixed_weights for key in ["ro", "aahedc", "ggl", "whd", "eco", "fit"]
-    },
+    "100% Electricity Variable": dict.fromkeys(
+        levy_names, electricity_variable_weights
+    ),
+    "100% Electricity Fixed": dict.fromkeys(levy_names, electricity_fixed_weights),
+    "100% Gas Variable": dict.fromkeys(levy_names, gas_variable_weights),
+    "100% Gas Fixed": dict.fromkeys(levy_names, gas_fixed_weights),
 }
 
 # %%
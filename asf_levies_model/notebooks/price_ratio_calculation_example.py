@@ -1,4 +1,6 @@
 # %%
+from types import MappingProxyType
+
 from asf_levies_model.getters.load_data import (
     download_annex_4,
     process_data_RO,
@@ -8,31 +10,18 @@ from asf_levies_model.getters.load_data import (
     process_data_ECO,
     process_data_FIT,
     download_annex_9,
-    process_tariff_elec_standard_credit_nil,
-    process_tariff_elec_standard_credit_typical,
-    process_tariff_gas_standard_credit_nil,
-    process_tariff_gas_standard_credit_typical,
     process_tariff_elec_other_payment_nil,
     process_tariff_elec_other_payment_typical,
     process_tariff_gas_other_payment_nil,
     process_tariff_gas_other_payment_typical,
-    process_tariff_elec_ppm_nil,
-    process_tariff_elec_ppm_typical,
-    process_tariff_gas_ppm_nil,
-    process_tariff_gas_ppm_typical,
     ofgem_archetypes_data,
 )
 
 from asf_levies_model.levies import RO, AAHEDC, GGL, WHD, ECO, FIT
 
-from asf_levies_model.tariffs import (
-    ElectricityStandardCredit,
-    GasStandardCredit,
-    ElectricityOtherPayment,
-    GasOtherPayment,
-    ElectricityPPM,
-    GasPPM,
-)
+from asf_levies_model.summary import calculate_tariff_policy_costs
+
+from asf_levies_model.tariffs import ElectricityOtherPayment, GasOtherPayment
 
 # %% [markdown]
 # Extracting tariff cost components: Other Payment method
@@ -135,16 +124,26 @@ print(policy_cost_fixed, policy_cost_variable)
 url = "https://www.ofgem.gov.uk/sites/default/files/2024-08/Annex_4_-_Policy_cost_allowance_methodology_v1.19%20%281%29.xlsx"
 download_annex_4(url)
 
+# Domestic supply and customer numbers from subnational consumption estimates
+domestic_values = MappingProxyType(
+    {
+        "supply_elec": DOMESTIC_SUPPLY_ELEC,
+        "supply_gas": DOMESTIC_SUPPLY_GAS,
+        "customers_gas": DOMESTIC_CUSTOMERS_GAS,
+        "customers_elec": DOMESTIC_CUSTOMERS_ELEC,
+    }
+)
+
 # Initialise the existing levies
 levies = [
     RO.from_dataframe(
-        process_data_RO(), denominator=94_200_366
+        process_data_RO(), denominator=domestic_values["supply_elec"]
     ),  # domestic denominator
     AAHEDC.from_dataframe(
-        process_data_AAHEDC(), denominator=94_200_366
+        process_data_AAHEDC(), denominator=domestic_values["supply_elec"]
     ),  # domestic denominator
     GGL.from_dataframe(
-        process_data_GGL(), denominator=24_503_683
+        process_data_GGL(), denominator=domestic_values["customers_gas"]
     ),  # domestic denominator
     WHD.from_dataframe(process_data_WHD()),  # domestic only levy
     ECO.from_dataframe(process_data_ECO()),  # domestic only levy
@@ -155,15 +154,9 @@ levies = [
 ]
 
 # Using just domestic values for rebalancing
-domestic_values = {
-    "supply_elec": 94_200_366,
-    "supply_gas": 265_197_947,
-    "customers_gas": 24_503_683,
-    "customers_elec": 29_078_770,
-}
-denominators = {
-    key: domestic_values for key in ["ro", "aahedc", "ggl", "whd", "eco", "fit"]
-}
+denominators = dict.fromkeys(
+    ("ro", "aahedc", "ggl", "whd", "eco", "fit"), domestic_values
+)
 
 # Rebalancing to 100% gas variable
 weights = {
@@ -181,20 +174,16 @@ weights = {
 gas_var_levies = [
     levy.rebalance_levy(**weights, **denominators[levy.short_name]) for levy in levies
 ]
+gas_var_policy_costs = calculate_tariff_policy_costs(gas_var_levies)
 
 # %%
 # Create new instance of electricity bill (theoretical)
-elec_bill_theoretical = ElectricityOtherPayment.from_dataframe(
-    elec_other_payment_nil, elec_other_payment_typical
-)
+elec_bill_theoretical = elec_bill.clone()
 
 # Update policy costs in bill
-elec_bill_theoretical.pc_nil = sum(
-    [levy.calculate_fixed_levy(True, False) for levy in gas_var_levies]
-)
-elec_bill_theoretical.pc = sum(
-    [levy.calculate_variable_levy(1, 0) for levy in gas_var_levies]
-)
+elec_bill_theoretical.pc_nil, elec_bill_theoretical.pc = gas_var_policy_costs[
+    "electricity"
+]
 
 elec_pc_theoretical = (
     elec_bill_theoretical.pc_nil - elec_bill_theoretical.pc * 2.7
@@ -207,18 +196,11 @@ elec_pc_theoretical
 
 # %%
 # Create new instance of gas bill (theoretical)
-gas_bill_theoretical = GasOtherPayment.from_dataframe(
-    gas_other_payment_nil, gas_other_payment_typical
-)
+gas_bill_theoretical = gas_bill.clone()
 
 # %%
 # Update gas policy costs
-gas_bill_theoretical.pc_nil = sum(
-    [levy.calculate_fixed_levy(False, True) for levy in gas_var_levies]
-)
-gas_bill_theoretical.pc = sum(
-    [levy.calculate_variable_levy(0, 1) for levy in gas_var_levies]
-)
+gas_bill_theoretical.pc_nil, gas_bill_theoretical.pc = gas_var_policy_costs["gas"]
 gas_pc_theoretical = (
     gas_bill_theoretical.pc_nil + (gas_bill_theoretical.pc * 11.5)
 ) * 1.05
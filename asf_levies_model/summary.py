@@ -1,41 +1,39 @@
+import numpy as np
 import pandas as pd
 from typing import Dict, Optional
 
 
-def _sum_levies(val: float, summary: str, fuel: str, levies: list) -> float:
-    """Calculate sum of levies.
+def calculate_tariff_policy_costs(levies: list) -> Dict[str, tuple]:
+    """Calculate tariff policy cost components for a collection of levies.
 
     Parameters
     ----------
-    val : float
-        Gas or electricity consumption value.
-    summary : str
-        Charging basis, can be 'fixed' or 'variable'.
-    fuel : str
-        Fuel type, can be 'gas' or 'electricity'.
     levies : list
         Collection of levies used to estimate policy costs.
+
     Returns
     -------
-    float
-        Policy cost component value for charging basis and fuel type given.
+    Dict[str, tuple]
+        Fuel type mapped to its (nil consumption, per MWh) policy costs, i.e. the
+        tariff pc_nil and pc values.
     """
-    if val == 0:
-        return 0.0
-    else:
-        method = {
-            "fixed": "calculate_fixed_levy",
-            "variable": "calculate_variable_levy",
-        }.get(summary)
-        args = (
-            {
-                "fixed": {"gas": (False, True), "electricity": (True, False)},
-                "variable": {"gas": (0, val), "electricity": (val, 0)},
-            }
-            .get(summary)
-            .get(fuel)
+    elec_nil, elec_unit, gas_nil, gas_unit = (
+        np.array(
+            [
+                [
+                    levy.calculate_fixed_levy(True, False),
+                    levy.calculate_variable_levy(1, 0),
+                    levy.calculate_fixed_levy(False, True),
+                    levy.calculate_variable_levy(0, 1),
+                ]
+                for levy in levies
+            ],
+            dtype=float,
         )
-        return sum([getattr(levy, method)(*args) for levy in levies])
+        .reshape(-1, 4)
+        .sum(axis=0)
+    )
+    return {"electricity": (elec_nil, elec_unit), "gas": (gas_nil, gas_unit)}
 
 
 def _calculate_policy_costs(
@@ -84,42 +82,29 @@ def _calculate_policy_costs(
     df[gas_column] = df[gas_column] / consumption_scale_factor
     df[electricity_column] = df[electricity_column] / consumption_scale_factor
 
+    # per MWh and per customer costs are summed over levies once, then broadcast
+    # across consumption profiles
+    policy_costs = calculate_tariff_policy_costs(levies)
+    fuel_columns = {"electricity": electricity_column, "gas": gas_column}
+
     summary_cols = []
     for summary in set(summaries).intersection(set(["fixed", "variable"])):
-        for col in [electricity_column, gas_column]:
-            fuel = "gas" if col == gas_column else "electricity"
-            summary_cols.append(
-                df[col]
-                .apply(lambda x: _sum_levies(x, summary, fuel, levies))
-                .rename(f"{fuel} {summary} levy costs")
-            )
+        for fuel, col in fuel_columns.items():
+            nil, unit = policy_costs[fuel]
+            # Fixed costs only apply where there is consumption of the fuel
+            values = nil * (df[col] != 0) if summary == "fixed" else unit * df[col]
+            summary_cols.append(values.rename(f"{fuel} {summary} levy costs"))
 
     if "total" in summaries:
+        elec_nil, elec_unit = policy_costs["electricity"]
+        gas_nil, gas_unit = policy_costs["gas"]
         summary_cols.append(
-            df[[gas_column, electricity_column]]
-            .apply(
-                lambda x: (
-                    sum(
-                        [
-                            levy.calculate_levy(
-                                x[electricity_column], x[gas_column], True, True
-                            )
-                            for levy in levies
-                        ]
-                    )
-                    if x[gas_column] != 0
-                    else sum(
-                        [
-                            levy.calculate_levy(
-                                x[electricity_column], x[gas_column], True, False
-                            )
-                            for levy in levies
-                        ]
-                    )
-                ),
-                axis=1,
-            )
-            .rename("total levy costs")
+            (
+                elec_nil
+                + elec_unit * df[electricity_column]
+                + gas_nil * (df[gas_column] != 0)
+                + gas_unit * df[gas_column]
+            ).rename("total levy costs")
         )
 
     consumption_values_df = pd.concat(
@@ -153,9 +138,10 @@ def _rebalance_levies(
     list
         A list of rebalanced levies.
     """
+    scenario_weights = rebalancing_weights.get(scenario_name)
     rebalanced_levies = [
         levy.rebalance_levy(
-            **rebalancing_weights.get(scenario_name).get(levy.short_name),
+            **scenario_weights.get(levy.short_name),
             **levy_denominators[levy.short_name],
         )
         for levy in levies
@@ -263,7 +249,9 @@ It is assumed that the rebalancing weights are the same for each levy.
             )
         )
 
-    return pd.concat([baseline] + scenarios, ignore_index=True)
+    return pd.concat(
+        ([baseline] if include_baseline else []) + scenarios, ignore_index=True
+    )
 
 
 def process_rebalancing_scenario_bills(
@@ -352,19 +340,17 @@ It is assumed that the rebalancing weights are the same for each levy.
             [consumption_profile_column],
         ]
 
-        summary_bill_costs_baseline[
-            "electricity bill incl VAT"
-        ] = consumption_values_df[electricity_column].apply(
-            lambda val: elec_bills.get("baseline").calculate_total_consumption(
-                val / consumption_scale_factor, vat=True
+        elec_bill, gas_bill = elec_bills.get("baseline"), gas_bills.get("baseline")
+        summary_bill_costs_baseline["electricity bill incl VAT"] = (
+            elec_bill.calculate_total_consumption(
+                consumption_values_df[electricity_column] / consumption_scale_factor,
+                vat=True,
             )
         )
 
-        summary_bill_costs_baseline["gas bill incl VAT"] = consumption_values_df[
-            gas_column
-        ].apply(
-            lambda val: gas_bills.get("baseline").calculate_total_consumption(
-                val / consumption_scale_factor, vat=True
+        summary_bill_costs_baseline["gas bill incl VAT"] = (
+            gas_bill.calculate_total_consumption(
+                consumption_values_df[gas_column] / consumption_scale_factor, vat=True
             )
         )
 
@@ -381,18 +367,10 @@ It is assumed that the rebalancing weights are the same for each levy.
             levies, rebalancing_weights, levy_denominators, scenario
         )
         # Update the bill policy costs in line with scenario
-        elec_bills.get(scenario).pc_nil = sum(
-            [levy.calculate_fixed_levy(True, False) for levy in new_levies]
-        )
-        elec_bills.get(scenario).pc = sum(
-            [levy.calculate_variable_levy(1, 0) for levy in new_levies]
-        )
-        gas_bills.get(scenario).pc_nil = sum(
-            [levy.calculate_fixed_levy(False, True) for levy in new_levies]
-        )
-        gas_bills.get(scenario).pc = sum(
-            [levy.calculate_variable_levy(0, 1) for levy in new_levies]
-        )
+        policy_costs = calculate_tariff_policy_costs(new_levies)
+        elec_bill, gas_bill = elec_bills.get(scenario), gas_bills.get(scenario)
+        elec_bill.pc_nil, elec_bill.pc = policy_costs["electricity"]
+        gas_bill.pc_nil, gas_bill.pc = policy_costs["gas"]
 
         summary_bill_costs_scenario = consumption_values_df.loc[
             :,
@@ -400,19 +378,16 @@ It is assumed that the rebalancing weights are the same for each levy.
                 consumption_profile_column,
             ],
         ]
-        summary_bill_costs_scenario[
-            "electricity bill incl VAT"
-        ] = consumption_values_df[electricity_column].apply(
-            lambda val: elec_bills.get(scenario).calculate_total_consumption(
-                val / consumption_scale_factor, vat=True
+        summary_bill_costs_scenario["electricity bill incl VAT"] = (
+            elec_bill.calculate_total_consumption(
+                consumption_values_df[electricity_column] / consumption_scale_factor,
+                vat=True,
             )
         )
 
-        summary_bill_costs_scenario["gas bill incl VAT"] = consumption_values_df[
-            gas_column
-        ].apply(
-            lambda val: gas_bills.get(scenario).calculate_total_consumption(
-                val / consumption_scale_factor, vat=True
+        summary_bill_costs_scenario["gas bill incl VAT"] = (
+            gas_bill.calculate_total_consumption(
+                consumption_values_df[gas_column] / consumption_scale_factor, vat=True
             )
         )
 
@@ -425,20 +400,10 @@ It is assumed that the rebalancing weights are the same for each levy.
 
         summary_bill_costs_scenarios[scenario] = summary_bill_costs_scenario
 
-    if include_baseline:
-        summary_bill_costs = pd.concat([summary_bill_costs_baseline])
-
-        for name in summary_bill_costs_scenarios.keys():
-            summary_bill_costs = pd.concat(
-                [summary_bill_costs, summary_bill_costs_scenarios[name]]
-            )
-    else:
-        summary_bill_costs = pd.concat(
-            [
-                summary_bill_costs_scenarios[name]
-                for name in summary_bill_costs_scenarios.keys()
-            ]
-        )
+    summary_bill_costs = pd.concat(
+        ([summary_bill_costs_baseline] if include_baseline else [])
+        + list(summary_bill_costs_scenarios.values())
+    )
 
     summary_bill_costs = summary_bill_costs.melt(
         id_vars=[consumption_profile_column, "scenario"]
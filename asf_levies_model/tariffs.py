@@ -1,3 +1,5 @@
+import copy
+
 import pandas as pd
 
 
@@ -151,25 +153,29 @@ class Tariff:
 
     def calculate_variable_consumption(self, consumption: float) -> float:
         """Calculate value for variable tariff component, given consumption value."""
-        return sum(
-            [
-                component * consumption
-                for component in [
-                    self.df,
-                    self.cm,
-                    self.aa,
-                    self.pc,
-                    self.nc,
-                    self.oc,
-                    self.smncc,
-                    self.paac,
-                    self.pap,
-                    self.ebit,
-                    self.hap,
-                    self.levelisation,
+        # All components are unit rates, so sum them before scaling by consumption.
+        return (
+            sum(
+                [
+                    component
+                    for component in [
+                        self.df,
+                        self.cm,
+                        self.aa,
+                        self.pc,
+                        self.nc,
+                        self.oc,
+                        self.smncc,
+                        self.paac,
+                        self.pap,
+                        self.ebit,
+                        self.hap,
+                        self.levelisation,
+                    ]
+                    if not pd.isna(component)
                 ]
-                if not pd.isna(component)
-            ]
+            )
+            * consumption
         )
 
     def calculate_total_consumption(self, consumption: float, vat: bool = False):
@@ -179,14 +185,22 @@ class Tariff:
 use the calculate_nil_consumption method.
 
         Args:
-            consumption: float, fuel consumption in MWh.
+            consumption: float or array-like (e.g. pd.Series), fuel consumption in MWh.
             vat: bool, whether to add VAT at 5%, default: False.
         """
+        # Standing charge only applies where there is consumption of the fuel
         return (
-            (self.calculate_nil_consumption() if consumption > 0 else 0)
+            self.calculate_nil_consumption() * (consumption > 0)
             + self.calculate_variable_consumption(consumption)
         ) * (1.05 if vat else 1.0)
 
+    def clone(self) -> "Tariff":
+        """Return a copy of the tariff, e.g. to give each rebalancing scenario its own bill.
+
+        All tariff components are scalars, so a shallow copy is independent of the original.
+        """
+        return copy.copy(self)
+
     def __str__(self):
         """String representation of tariff name."""
         return f"{self.name}"